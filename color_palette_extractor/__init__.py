@@ -8,6 +8,7 @@ __version__ = "2.1.0"
 __author__ = "Michail Semoglou"
 
 import os
+import importlib
 
 # Define paths for resources
 PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -21,12 +22,33 @@ VERSION_INFO = {
     "status": "stable",
 }
 
-# Make key functions available at package level
-from .core import extract_color_palette
-from .harmonies import get_harmonies
-from .output.pdf import save_palette_to_pdf
-from .output.text import save_palette_and_harmonies
-from .batch import process_images, process_folder
+# Make key functions available at package level. They are imported lazily
+# (PEP 562) so that importing the package does not pull in scikit-learn,
+# ReportLab and Pillow until one of these names is actually used.
+_LAZY_IMPORTS = {
+    "extract_color_palette": ".core",
+    "get_harmonies": ".harmonies",
+    "save_palette_to_pdf": ".output.pdf",
+    "save_palette_and_harmonies": ".output.text",
+    "process_images": ".batch",
+    "iter_process_images": ".batch",
+    "process_folder": ".batch",
+}
+
+__all__ = list(_LAZY_IMPORTS) + ["get_version_string"]
+
+def __getattr__(name):
+    """Import package-level functions on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 def get_version_string():
     """Return version string."""
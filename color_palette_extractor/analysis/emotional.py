@@ -6,9 +6,11 @@ Advanced emotional and psychological color analysis for Color Palette Extractor.
 Designed specifically for design students and professionals.
 """
 
-import colorsys
-import math
 import logging
+import sys
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
@@ -287,6 +289,75 @@ COLOR_EMOTIONS = {
     }
 }
 
+# The emotion database is read-only: freeze it so the same tuples are shared
+# by every analysis and cannot be mutated by callers. Terms are interned, so
+# counting them compares string identities rather than contents; color names
+# are interned for the same reason, as they key every lookup table
+COLOR_EMOTIONS = MappingProxyType({
+    sys.intern(name): MappingProxyType({key: tuple(map(sys.intern, values)) for key, values in info.items()})
+    for name, info in COLOR_EMOTIONS.items()
+})
+
+# Integer identifiers for the color names, in COLOR_EMOTIONS order
+COLOR_NAMES = tuple(COLOR_EMOTIONS)
+_COLOR_IDS = {name: i for i, name in enumerate(COLOR_NAMES)}
+
+def _color_mask(names):
+    """Pack color names into a bitmask with one bit per COLOR_NAMES index.
+
+    Args:
+        names (iterable): Color names from COLOR_NAMES
+
+    Returns:
+        int: Bitmask of the given colors
+    """
+    mask = 0
+    for name in names:
+        mask |= 1 << _COLOR_IDS[name]
+    return mask
+
+# Detailed color names grouped under their base color
+_BASE_COLOR_MAP = {
+    "burgundy": "red", "crimson": "red", "maroon": "red", "scarlet": "red",
+    "terracotta": "orange", "coral": "orange", "apricot": "orange", "peach": "orange",
+    "gold": "yellow", "mustard": "yellow", "amber": "yellow", "lemon": "yellow",
+    "sage": "green", "mint": "green", "olive": "green", "emerald": "green",
+    "forest": "green", "lime": "green",
+    "navy": "blue", "sky blue": "blue", "turquoise": "blue", "cobalt": "blue",
+    "periwinkle": "blue",
+    "lavender": "purple", "indigo": "purple", "violet": "purple", "plum": "purple",
+    "mauve": "purple",
+    "rose": "pink", "fuchsia": "pink", "salmon": "pink",
+    "beige": "brown", "tan": "brown", "chocolate": "brown", "taupe": "brown",
+    "charcoal": "gray", "silver": "gray",
+    "ivory": "white", "cream": "white"
+}
+
+# Flat (emotions, associations, brand_fit) lookup with the base color fallback
+# already applied, so each color needs a single fetch
+_EMPTY_INFO = ((), (), ())
+_COLOR_INFO = {}
+for _name in (*COLOR_EMOTIONS, *_BASE_COLOR_MAP):
+    _info = COLOR_EMOTIONS.get(_name) or COLOR_EMOTIONS.get(_BASE_COLOR_MAP.get(_name, _name))
+    _COLOR_INFO[_name] = (
+        (_info["emotions"], _info["associations"], _info["brand_fit"]) if _info else _EMPTY_INFO
+    )
+del _name, _info
+
+# Base color combinations used to detect complementary and analogous palettes
+_COMPLEMENTARY_MASKS = (
+    _color_mask(("red", "green")),
+    _color_mask(("blue", "orange")),
+    _color_mask(("yellow", "purple")),
+)
+_WHITE_MASK = _color_mask(("white",))
+_ANALOGOUS_MASKS = (
+    _color_mask(("red", "orange", "yellow")),
+    _color_mask(("yellow", "green", "teal")),
+    _color_mask(("teal", "blue", "purple")),
+    _color_mask(("purple", "pink", "red")),
+)
+
 HARMONY_EFFECTS = {
     "complementary": "vibrant, high-contrast palette that commands attention. Ideal for brands wanting to stand out or create visual energy. Effective for call-to-action elements and creating bold visual impact",
     "analogous": "harmonious, cohesive palette with natural flow and low visual tension. Perfect for creating a unified, professional look that feels balanced and intentionally designed",
@@ -295,6 +366,12 @@ HARMONY_EFFECTS = {
     "monochromatic": "sophisticated, cohesive palette with subtle depth. Particularly effective for luxury brands, minimalist designs, and contexts where content should be the focal point"
 }
 
+# Closing recommendation sentence for each harmony, built once from HARMONY_EFFECTS
+_HARMONY_SENTENCES = {
+    harmony: f"The {harmony} color relationship creates a {effect}."
+    for harmony, effect in HARMONY_EFFECTS.items()
+}
+
 def identify_color_name(hsv):
     """Identify detailed color name based on HSV values.
     
@@ -468,17 +545,154 @@ def identify_color_name(hsv):
     
     return "gray"
 
+@lru_cache(maxsize=8192)
+def _rgb_to_info(rgb_packed):
+    """Resolve a packed 24-bit RGB integer to its full emotional profile.
+
+    The whole RGB -> HSV -> name -> emotions pipeline is deterministic, so it
+    is memoized on the packed integer, which is cheaper to hash than an HSV
+    float tuple. Repeated palette colors cost a single cache lookup.
+
+    Args:
+        rgb_packed (int): Color packed as (r << 16) | (g << 8) | b
+
+    Returns:
+        tuple: (color_name, intensity, emotions, associations, brand_fit)
+    """
+    r = (rgb_packed >> 16) / 255
+    g = ((rgb_packed >> 8) & 0xFF) / 255
+    b = (rgb_packed & 0xFF) / 255
+
+    # Inlined colorsys.rgb_to_hsv
+    maxc = max(r, g, b)
+    minc = min(r, g, b)
+    v = maxc
+    if minc == maxc:
+        h = s = 0.0
+    else:
+        rangec = maxc - minc
+        s = rangec / maxc
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+        if r == maxc:
+            h = bc - gc
+        elif g == maxc:
+            h = 2.0 + rc - bc
+        else:
+            h = 4.0 + gc - rc
+        h = (h / 6.0) % 1.0
+
+    color_name = identify_color_name((h, s, v))
+    
+    emotions_info = _COLOR_INFO.get(color_name) or _COLOR_INFO["gray"]
+    intensity = "strong" if s > 0.7 and v > 0.7 else "moderate" if s > 0.4 else "subtle"
+    return (color_name, intensity) + emotions_info
+
+@lru_cache(maxsize=None)
+def _decide_harmony(base_mask):
+    """Decide the dominant harmony of a palette from its base colors.
+
+    There are only a few thousand base color combinations, so every decision
+    is memoized on the bitmask.
+
+    Args:
+        base_mask (int): Bitmask of the palette's base colors (see _color_mask)
+
+    Returns:
+        str: Harmony type, one of the HARMONY_EFFECTS keys or "mixed"
+    """
+    color_diversity = bin(base_mask).count("1")
+    if color_diversity == 1 or (color_diversity == 2 and base_mask & _WHITE_MASK):
+        return "monochromatic"
+    
+    has_complementary = any(base_mask & pair == pair for pair in _COMPLEMENTARY_MASKS)
+    has_analogous = any(base_mask & group == group for group in _ANALOGOUS_MASKS)
+    
+    if has_complementary and not has_analogous:
+        return "complementary"
+    elif has_analogous and not has_complementary:
+        return "analogous"
+    elif color_diversity >= 4:
+        return "tetradic"
+    elif color_diversity == 3:
+        return "triadic"
+    else:
+        return "mixed"
+
+def _analyze_color(hex_color, rgb_packed):
+    """Build the emotional profile of a single palette color.
+
+    Args:
+        hex_color (str): Hex color code
+        rgb_packed (int): Color packed as (r << 16) | (g << 8) | b
+
+    Returns:
+        dict: Color name, emotions, associations, brand fit and intensity
+    """
+    color_name, intensity, emotions, associations, brand_fit = _rgb_to_info(rgb_packed)
+    
+    return {
+        "hex": hex_color,
+        "color_name": color_name,
+        "emotions": emotions,
+        "associations": associations,
+        "brand_fit": brand_fit,
+        "intensity": intensity
+    }
+
 def analyze_palette_emotions(color_palette):
     """Analyze the emotional impact of a color palette.
     
+    Identical palettes are analyzed once and served from a cache; every call
+    still returns its own result containers, so callers may modify them.
+    
     Args:
         color_palette (list): List of color tuples from extract_color_palette
         
     Returns:
         dict: Emotional analysis results
     """
+    palette_key = []
+    for color in color_palette:
+        r, g, b = (int(val) for val in color[1])
+        palette_key.append((color[0], (r << 16) | (g << 8) | b))
+    
+    cached = _analyze_palette(tuple(palette_key))
+    overall = cached["overall"]
+    
+    # The database stores tuples; results keep the lists they always had
+    return {
+        "colors": [
+            dict(
+                color_result,
+                emotions=list(color_result["emotions"]),
+                associations=list(color_result["associations"]),
+                brand_fit=list(color_result["brand_fit"])
+            )
+            for color_result in cached["colors"]
+        ],
+        "overall": {
+            "dominant_emotions": list(overall["dominant_emotions"]),
+            "harmony_analysis": overall["harmony_analysis"],
+            "brand_recommendations": overall["brand_recommendations"]
+        }
+    }
+
+@lru_cache(maxsize=256)
+def _analyze_palette(palette_key):
+    """Analyze a palette given as a hashable tuple of (hex_color, rgb_packed) pairs.
+    
+    Args:
+        palette_key (tuple): (hex_color, rgb_packed) pair for each palette color
+        
+    Returns:
+        dict: Emotional analysis results, shared between cache hits
+    """
+    color_results = [_analyze_color(hex_color, rgb_packed) for hex_color, rgb_packed in palette_key]
+
     results = {
-        "colors": [],
+        "colors": color_results,
         "overall": {
             "dominant_emotions": [],
             "harmony_analysis": "",
@@ -486,146 +700,52 @@ def analyze_palette_emotions(color_palette):
         }
     }
     
-    emotion_counts = {}
-    color_names = []
+    # Tally emotions and base colors in a single pass over the palette
+    emotion_counts = Counter()
+    color_name_counts = Counter()
+    for color_result in color_results:
+        emotion_counts.update(color_result["emotions"])
+        color_name = color_result["color_name"]
+        color_name_counts[_BASE_COLOR_MAP.get(color_name, color_name)] += 1
     
-    for i, color in enumerate(color_palette):
-        hex_color, rgb, cmyk = color
-        
-        r, g, b = [val/255 for val in rgb]
-        h, s, v = colorsys.rgb_to_hsv(r, g, b)
-        
-        color_name = identify_color_name((h, s, v))
-        color_names.append(color_name)
-        
-        base_color = color_name
-        if color_name not in COLOR_EMOTIONS:
-            color_mapping = {
-                "burgundy": "red", "crimson": "red", "maroon": "red", "scarlet": "red",
-                "terracotta": "orange", "coral": "orange", "apricot": "orange", "peach": "orange",
-                "gold": "yellow", "mustard": "yellow", "amber": "yellow", "lemon": "yellow",
-                "sage": "green", "mint": "green", "olive": "green", "emerald": "green", 
-                "forest": "green", "lime": "green",
-                "navy": "blue", "sky blue": "blue", "turquoise": "blue", "cobalt": "blue", 
-                "periwinkle": "blue",
-                "lavender": "purple", "indigo": "purple", "violet": "purple", "plum": "purple", 
-                "mauve": "purple",
-                "rose": "pink", "fuchsia": "pink", "salmon": "pink",
-                "beige": "brown", "tan": "brown", "chocolate": "brown", "taupe": "brown",
-                "charcoal": "gray", "silver": "gray",
-                "ivory": "white", "cream": "white"
-            }
-            base_color = color_mapping.get(color_name, "gray")
-        
-        emotions = COLOR_EMOTIONS.get(color_name, COLOR_EMOTIONS.get(base_color, {})).get("emotions", [])
-        associations = COLOR_EMOTIONS.get(color_name, COLOR_EMOTIONS.get(base_color, {})).get("associations", [])
-        brand_fit = COLOR_EMOTIONS.get(color_name, COLOR_EMOTIONS.get(base_color, {})).get("brand_fit", [])
-        
-        color_result = {
-            "hex": hex_color,
-            "color_name": color_name,
-            "emotions": emotions,
-            "associations": associations,
-            "brand_fit": brand_fit,
-            "intensity": "strong" if s > 0.7 and v > 0.7 else "moderate" if s > 0.4 else "subtle"
-        }
-        results["colors"].append(color_result)
-        
-        for emotion in emotions:
-            if emotion in emotion_counts:
-                emotion_counts[emotion] += 1
-            else:
-                emotion_counts[emotion] = 1
-    
-    sorted_emotions = sorted(emotion_counts.items(), key=lambda x: x[1], reverse=True)
-    results["overall"]["dominant_emotions"] = [emotion for emotion, count in sorted_emotions[:3]]
-    
-    color_name_counts = {}
-    for name in color_names:
-        base_name = name
-        color_groups = {
-            "burgundy": "red", "crimson": "red", "maroon": "red", "scarlet": "red",
-            "terracotta": "orange", "coral": "orange", "apricot": "orange", "peach": "orange",
-            "gold": "yellow", "mustard": "yellow", "amber": "yellow", "lemon": "yellow",
-            "sage": "green", "mint": "green", "olive": "green", "emerald": "green",
-            "forest": "green", "lime": "green",
-            "navy": "blue", "sky blue": "blue", "turquoise": "blue", "cobalt": "blue",
-            "periwinkle": "blue",
-            "lavender": "purple", "indigo": "purple", "violet": "purple", "plum": "purple",
-            "mauve": "purple",
-            "rose": "pink", "fuchsia": "pink", "salmon": "pink",
-            "beige": "brown", "tan": "brown", "chocolate": "brown", "taupe": "brown",
-            "charcoal": "gray", "silver": "gray",
-            "ivory": "white", "cream": "white"
-        }
-        base_name = color_groups.get(name, name)
-        
-        if base_name in color_name_counts:
-            color_name_counts[base_name] += 1
-        else:
-            color_name_counts[base_name] = 1
-    
-    unique_colors = list(set(color_names))
-    
-    color_diversity = len(color_name_counts)
-    
-    base_colors = list(color_name_counts.keys())
-    has_complementary = len(set(["red", "green"]).intersection(set(base_colors))) == 2 or \
-                       len(set(["blue", "orange"]).intersection(set(base_colors))) == 2 or \
-                       len(set(["yellow", "purple"]).intersection(set(base_colors))) == 2
-                       
-    has_analogous = any(
-        sum(1 for name in base_colors if name in group) >= 3
-        for group in [
-            ["red", "orange", "yellow"],
-            ["yellow", "green", "teal"],
-            ["teal", "blue", "purple"],
-            ["purple", "pink", "red"]
-        ]
-    )
+    results["overall"]["dominant_emotions"] = [emotion for emotion, count in emotion_counts.most_common(3)]
+    
+    # Keep palette order so the summary is stable across runs
+    unique_colors = list(dict.fromkeys(color_result["color_name"] for color_result in color_results))
     
-    dominant_harmony = None
-    if len(color_name_counts) == 1 or (len(color_name_counts) == 2 and "white" in color_name_counts):
+    # Harmony detection works on a bitmask of the palette's base colors
+    if len(color_name_counts) == 1:
         dominant_harmony = "monochromatic"
-    elif has_complementary and not has_analogous:
-        dominant_harmony = "complementary"
-    elif has_analogous and not has_complementary:
-        dominant_harmony = "analogous"
-    elif color_diversity >= 4:
-        dominant_harmony = "tetradic"
-    elif color_diversity == 3:
-        dominant_harmony = "triadic"
     else:
-        dominant_harmony = "mixed"
+        dominant_harmony = _decide_harmony(_color_mask(color_name_counts))
     
-    if dominant_harmony in HARMONY_EFFECTS:
-        results["overall"]["harmony_analysis"] = HARMONY_EFFECTS[dominant_harmony]
-    else:
-        results["overall"]["harmony_analysis"] = "Mixed color harmony providing a balanced visual effect."
+    harmony_effect = HARMONY_EFFECTS.get(dominant_harmony)
+    results["overall"]["harmony_analysis"] = (
+        harmony_effect or "Mixed color harmony providing a balanced visual effect."
+    )
     
-    primary_colors = [name for name, count in sorted(color_name_counts.items(), key=lambda x: x[1], reverse=True)]
+    # Only the two most frequent base colors drive the industry recommendations
+    primary_colors = [name for name, count in color_name_counts.most_common(2)]
     
     if not primary_colors:
         results["overall"]["brand_recommendations"] = "Unable to determine brand recommendations."
     else:
-        industry_fits = []
-        for color in primary_colors[:2]:
-            if color in COLOR_EMOTIONS:
-                industry_fits.extend(COLOR_EMOTIONS[color]["brand_fit"])
+        industry_fits = [
+            industry for color in primary_colors
+            for industry in _COLOR_INFO.get(color, _EMPTY_INFO)[2]
+        ]
         
-        top_industries = list(set(industry_fits))[:3]
+        # Deduplicate while keeping the most dominant color's industries first
+        top_industries = list(dict.fromkeys(industry_fits))[:3]
         
         emotion_str = ", ".join(results["overall"]["dominant_emotions"])
         industry_str = ", ".join(top_industries) if top_industries else "various industries"
         color_str = ", ".join(unique_colors[:4])
         
-        recommendations = f"This color palette features {color_str} and evokes feelings of {emotion_str}. "
-        recommendations += f"It would be well-suited for brands in {industry_str}. "
-        
-        if dominant_harmony and dominant_harmony in HARMONY_EFFECTS:
-            harmony_effect = HARMONY_EFFECTS[dominant_harmony]
-            recommendations += f"The {dominant_harmony} color relationship creates a {harmony_effect}."
-        
-        results["overall"]["brand_recommendations"] = recommendations
+        results["overall"]["brand_recommendations"] = "".join((
+            f"This color palette features {color_str} and evokes feelings of {emotion_str}. ",
+            f"It would be well-suited for brands in {industry_str}. ",
+            _HARMONY_SENTENCES.get(dominant_harmony, "")
+        ))
     
     return results
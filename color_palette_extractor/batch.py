@@ -6,10 +6,15 @@ Batch processing functionality for the Color Palette Extractor.
 """
 
 import os
+import sys
 import time
 import logging
+import hashlib
+import itertools
 import traceback
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from tqdm import tqdm
 
 from .core import extract_color_palette
@@ -21,9 +26,133 @@ from color_palette_extractor.utils.cache import CacheManager
 
 logger = logging.getLogger(__name__)
 
+# Cache manager and configuration of the current worker process, set once by _init_worker
+_worker_cache_manager = None
+_worker_config = None
+
+def _cache_manager(cache_dir, config=None):
+    """Open the palette cache for a batch.
+    
+    Args:
+        cache_dir (str or None): Cache directory, or None to disable caching
+        config (dict, optional): Configuration options; 'cache_key_mode'
+            selects the CacheManager key mode
+        
+    Returns:
+        CacheManager or None: Cache manager, or None if caching is disabled
+    """
+    if cache_dir is None:
+        return None
+    return CacheManager(cache_dir, key_mode=(config or {}).get('cache_key_mode', 'mtime'))
+
+def _init_worker(cache_dir, config=None):
+    """Set up a worker process once, before it runs any task.
+    
+    Opens the palette cache and preloads the emotional analysis modules when
+    they will be needed, so their import cost is not paid by the first task.
+    
+    Args:
+        cache_dir (str or None): Cache directory, or None to disable caching
+        config (dict, optional): Configuration options shared by all tasks
+    """
+    global _worker_cache_manager, _worker_config
+    _worker_cache_manager = _cache_manager(cache_dir, config)
+    _worker_config = config
+    
+    if config and config.get('emotional_analysis'):
+        try:
+            import color_palette_extractor.analysis.emotional  # noqa: F401
+            import color_palette_extractor.output.emotional  # noqa: F401
+        except ImportError as e:
+            logger.debug(f"Could not preload emotional analysis modules: {str(e)}")
+
+# Number of paths sent to a worker at a time when the batch size is unknown
+_STREAM_CHUNKSIZE = 16
+
+# Number of tasks kept in flight per worker process; bounds the paths read
+# ahead of the results, while keeping every worker busy
+_TASKS_PER_WORKER = 4
+
+def _progress(iterable, total):
+    """Wrap an iterable in a progress bar that redraws at a bounded rate.
+    
+    The bar refreshes at most every half second and every 0.5% of the batch,
+    and is disabled when stderr is missing (e.g. pythonw, windowed GUI builds)
+    or is not a terminal (logs, CI, pipes).
+    
+    Args:
+        iterable (iterable or None): Results or paths to iterate over,
+            or None for a bar updated manually
+        total (int or None): Number of items, or None if unknown
+        
+    Returns:
+        tqdm: Progress bar iterating over iterable
+    """
+    return tqdm(iterable, total=total, desc="Processing images",
+                mininterval=0.5, miniters=max(1, (total or 0) // 200),
+                disable=not (sys.stderr and sys.stderr.isatty()))
+
+# Output directories already created by this process during the current batch
+_ensured_dirs = set()
+
+def _ensure_dir(path):
+    """Create a directory once per process; later calls for it are free.
+    
+    Args:
+        path (str): Directory path
+    """
+    if path not in _ensured_dirs:
+        os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
+def _atomic_write(path, writer, sibling_exts=()):
+    """Write an output file under a temporary name and move it into place.
+    
+    An interrupted or failed write never leaves a truncated file at path that
+    a later run with skip_existing would take as up to date. The temporary
+    name keeps the extension, so writers that derive sibling files from it
+    (e.g. the emotional analysis JSON) can have those moved along with it.
+    
+    Args:
+        path (str): Final output file path
+        writer (callable): Function writing the output to the path it is given
+        sibling_exts (tuple): Extensions of sibling files the writer also creates
+    """
+    root, ext = os.path.splitext(path)
+    tmp_root = f"{root}.{os.getpid()}.tmp"
+    moves = [(tmp_root + ext, path)]
+    moves.extend((tmp_root + sibling_ext, root + sibling_ext) for sibling_ext in sibling_exts)
+    try:
+        writer(tmp_root + ext)
+        for tmp_path, final_path in moves:
+            os.replace(tmp_path, final_path)
+    except BaseException:
+        for tmp_path, _ in moves:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        raise
+
+def _outputs_up_to_date(image_path, output_files):
+    """Check whether all output files exist and are newer than their image.
+    
+    Args:
+        image_path (str): Path to the source image
+        output_files (list): Paths of the expected output files
+        
+    Returns:
+        bool: True if every output exists and is at least as new as the image
+    """
+    image_mtime = os.stat(image_path).st_mtime
+    try:
+        return all(os.stat(path).st_mtime >= image_mtime for path in output_files)
+    except OSError:
+        return False
+
 def process_single_image(image_path, num_colors=6, output_dir=None, 
                         generate_pdf=True, generate_text=True, 
-                        cache_manager=None, config=None):
+                        cache_manager=None, config=None, palette=None):
     """Process a single image to extract color palette and harmonies.
     
     Args:
@@ -34,7 +163,11 @@ def process_single_image(image_path, num_colors=6, output_dir=None,
         generate_pdf (bool): Whether to generate a PDF report
         generate_text (bool): Whether to generate a text file
         cache_manager (CacheManager, optional): Cache manager instance
+            If None, the worker process cache (if any) is used
         config (dict, optional): Configuration options
+            If None, the worker process configuration (if any) is used
+        palette (list, optional): Already extracted palette of this image's
+            content, e.g. from a byte-identical file; skips extraction
             
     Returns:
         dict: Processing result with keys:
@@ -43,9 +176,14 @@ def process_single_image(image_path, num_colors=6, output_dir=None,
             - error: Error message if processing failed
             - output_files: List of output file paths
             - processing_time: Processing time in seconds
+            - palette: Extracted palette, if the image was processed with
+              the 'dedup' config option (for its duplicates); absent when
+              the image was skipped with 'skip_existing'
     """
     start_time = time.time()
     output_files = []
+    if config is None:
+        config = _worker_config
     
     try:
         # Validate input file
@@ -72,17 +210,43 @@ def process_single_image(image_path, num_colors=6, output_dir=None,
             output_dir = os.path.dirname(image_path)
         
         # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        _ensure_dir(output_dir)
         
         # Create output filenames
         basename = os.path.splitext(os.path.basename(image_path))[0]
         pdf_path = os.path.join(output_dir, f"{basename}_palette.pdf")
         text_path = os.path.join(output_dir, f"{basename}_info.txt")
         
+        # Skip images whose outputs from an earlier run are still current
+        if config and config.get('skip_existing'):
+            expected_files = []
+            # Outputs written alongside the reported ones, e.g. the emotions JSON
+            sibling_files = []
+            if generate_text:
+                if config.get('emotional_analysis'):
+                    expected_files.append(os.path.join(output_dir, f"{basename}_emotions.txt"))
+                    sibling_files.append(os.path.join(output_dir, f"{basename}_emotions.json"))
+                expected_files.append(text_path)
+            if generate_pdf:
+                expected_files.append(pdf_path)
+            
+            if expected_files and _outputs_up_to_date(image_path, expected_files + sibling_files):
+                logger.info(f"Skipping {image_path}: outputs are up to date")
+                return {
+                    'image_path': image_path,
+                    'success': True,
+                    'output_files': expected_files,
+                    'processing_time': time.time() - start_time
+                }
+        
         # Check cache for palette
-        palette = None
-        if cache_manager is not None:
-            palette = cache_manager.get_cached_result(image_path, num_colors)
+        if cache_manager is None:
+            cache_manager = _worker_cache_manager
+        image_stat = None
+        if palette is None and cache_manager is not None:
+            # The lookup and the store below share one stat of the image
+            image_stat = os.stat(image_path)
+            palette = cache_manager.get_cached_result(image_path, num_colors, image_stat)
         
         # Extract palette if not in cache
         if palette is None:
@@ -90,7 +254,7 @@ def process_single_image(image_path, num_colors=6, output_dir=None,
             
             # Store in cache if cache manager is available
             if cache_manager is not None:
-                cache_manager.store_result(image_path, num_colors, palette)
+                cache_manager.store_result(image_path, num_colors, palette, image_stat)
         
         # Generate harmonies
         harmonies = get_harmonies(palette)
@@ -107,7 +271,11 @@ def process_single_image(image_path, num_colors=6, output_dir=None,
                 
                 if generate_text:
                     emotional_filename = os.path.join(output_dir, f"{basename}_emotions.txt")
-                    save_emotional_analysis(emotional_analysis, emotional_filename)
+                    _atomic_write(
+                        emotional_filename,
+                        partial(save_emotional_analysis, emotional_analysis),
+                        sibling_exts=(".json",)
+                    )
                     output_files.append(emotional_filename)
                     logger.debug(f"Saved emotional analysis to {emotional_filename}")
             except Exception as e:
@@ -117,29 +285,32 @@ def process_single_image(image_path, num_colors=6, output_dir=None,
         
         # Save outputs
         if generate_text:
-            save_palette_and_harmonies(palette, harmonies, filename=text_path)
+            _atomic_write(text_path, partial(save_palette_and_harmonies, palette, harmonies))
             output_files.append(text_path)
         
         if generate_pdf:
-            save_palette_to_pdf(
+            _atomic_write(pdf_path, lambda tmp_path: save_palette_to_pdf(
                 palette, 
                 harmonies, 
-                filename=pdf_path, 
+                filename=tmp_path, 
                 image_filename=image_path,
                 emotional_analysis=emotional_analysis,
                 config=config
-            )
+            ))
             output_files.append(pdf_path)
         
         processing_time = time.time() - start_time
-        logger.info(f"Processed {image_path} in {processing_time:.2f} seconds")
+        logger.debug(f"Processed {image_path} in {processing_time:.2f} seconds")
         
-        return {
+        result = {
             'image_path': image_path,
             'success': True,
             'output_files': output_files,
             'processing_time': processing_time
         }
+        if config and config.get('dedup'):
+            result['palette'] = palette
+        return result
         
     except Exception as e:
         logger.error(f"Error processing {image_path}: {str(e)}")
@@ -153,13 +324,179 @@ def process_single_image(image_path, num_colors=6, output_dir=None,
             'processing_time': time.time() - start_time
         }
 
-def process_images(image_paths, num_colors=6, output_dir=None, 
-                 generate_pdf=True, generate_text=True, 
-                 use_cache=True, max_workers=None, config=None):
-    """Process multiple images in parallel.
+def _iter_existing_files(paths, missing_paths):
+    """Yield the paths that are existing files, collecting the others.
     
     Args:
-        image_paths (list): List of image file paths
+        paths (iterable): Image file paths
+        missing_paths (list): List the paths that are not files are appended to
+        
+    Yields:
+        str: Path of an existing file
+    """
+    for path in paths:
+        if os.path.isfile(path):
+            yield path
+        else:
+            missing_paths.append(path)
+
+def _chunks(paths, size):
+    """Split an iterable of paths into lists, reading it lazily.
+    
+    Args:
+        paths (iterable): Image file paths
+        size (int): Maximum number of paths per list
+        
+    Yields:
+        list: Next paths, at most size of them
+    """
+    iterator = iter(paths)
+    chunk = list(itertools.islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(iterator, size))
+
+def _process_chunk(image_paths, skip_missing=False, **kwargs):
+    """Process a list of images in a worker process.
+    
+    Args:
+        image_paths (list): Image file paths
+        skip_missing (bool): Whether paths that are not files are skipped
+            rather than processed (and reported as failed)
+        **kwargs: Arguments passed on to process_single_image
+        
+    Returns:
+        list: Processing result of each image, or None for a skipped path
+    """
+    return [
+        None if skip_missing and not os.path.isfile(path) else process_single_image(path, **kwargs)
+        for path in image_paths
+    ]
+
+def _failed_result(image_path, error):
+    """Build the result of an image that could not be processed.
+    
+    Args:
+        image_path (str): Path to the image file
+        error (str): Error message
+        
+    Returns:
+        dict: Processing result (see process_single_image)
+    """
+    return {
+        'image_path': image_path,
+        'success': False,
+        'error': error,
+        'output_files': [],
+        'processing_time': 0
+    }
+
+def _content_key(path):
+    """Hash the full contents of a file.
+    
+    Args:
+        path (str): File path
+        
+    Returns:
+        bytes: BLAKE2b digest of the file contents
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.digest()
+
+def _group_duplicates(image_paths):
+    """Collapse byte-identical files onto the first path holding their content.
+    
+    Files are first grouped by size, so only files sharing a size with another
+    one are read and hashed (in a thread pool, as hashing is I/O bound).
+    
+    Args:
+        image_paths (list): Paths of existing image files
+        
+    Returns:
+        tuple: (unique_paths, duplicates) where unique_paths lists the first
+            path of each distinct content in input order, and duplicates maps
+            such a path to the list of later paths with the same content
+    """
+    paths_by_size = {}
+    for path in image_paths:
+        paths_by_size.setdefault(os.path.getsize(path), []).append(path)
+    candidates = [path for paths in paths_by_size.values() if len(paths) > 1 for path in paths]
+    
+    content_keys = {}
+    if candidates:
+        with ThreadPoolExecutor() as executor:
+            content_keys = dict(zip(candidates, executor.map(_content_key, candidates)))
+    
+    unique_paths = []
+    duplicates = {}
+    first_path_by_key = {}
+    for path in image_paths:
+        key = content_keys.get(path)
+        if key is None:
+            unique_paths.append(path)
+            continue
+        first_path = first_path_by_key.setdefault(key, path)
+        if first_path is path:
+            unique_paths.append(path)
+        else:
+            duplicates.setdefault(first_path, []).append(path)
+    
+    return unique_paths, duplicates
+
+def _duplicate_results(result, duplicates, num_colors, output_dir,
+                       generate_pdf, generate_text, config):
+    """Yield the results of the duplicates of an image from the image's result.
+    
+    Duplicates reuse the palette extracted for the image, so only their own
+    outputs are written. If the image failed, its duplicates fail the same way.
+    
+    Args:
+        result (dict): Processing result of the image (see process_single_image)
+        duplicates (dict): Duplicate paths keyed by image path (see _group_duplicates)
+        num_colors (int): Number of colors to extract
+        output_dir (str, optional): Directory to save output files
+        generate_pdf (bool): Whether to generate PDF reports
+        generate_text (bool): Whether to generate text files
+        config (dict, optional): Configuration options
+        
+    Yields:
+        dict: Processing result of each duplicate
+    """
+    for path in duplicates.get(result['image_path'], ()):
+        if result['success']:
+            yield process_single_image(
+                path, 
+                num_colors, 
+                output_dir, 
+                generate_pdf, 
+                generate_text, 
+                None,
+                config,
+                palette=result.get('palette')
+            )
+        else:
+            yield _failed_result(path, result.get('error'))
+
+def iter_process_images(image_paths, num_colors=6, output_dir=None, 
+                        generate_pdf=True, generate_text=True, 
+                        use_cache=True, max_workers=None, config=None):
+    """Process multiple images in parallel, yielding each result when it is ready.
+    
+    Results are yielded in input order as soon as they are available, so
+    callers can report progress or stream results before the batch finishes.
+    Only a few tasks per worker are in flight at any time, so image_paths may
+    also be an iterator (e.g. lines of a file list): it is read as the work
+    progresses, and its paths are checked for existence by the workers.
+    Paths that are not files are skipped with a warning, as for lists.
+    With the 'dedup' config option, byte-identical images are analyzed once;
+    the later copies reuse the palette, and their results follow the result
+    of the first copy.
+    
+    Args:
+        image_paths (iterable): Image file paths
         num_colors (int): Number of colors to extract
         output_dir (str, optional): Directory to save output files
         generate_pdf (bool): Whether to generate PDF reports
@@ -168,43 +505,63 @@ def process_images(image_paths, num_colors=6, output_dir=None,
         max_workers (int, optional): Maximum number of worker processes
         config (dict, optional): Configuration options
             
-    Returns:
-        dict: Processing results summary with keys:
-            - total: Total number of images
-            - successful: Number of successfully processed images
-            - failed: Number of failed images
-            - processing_time: Total processing time in seconds
-            - results: List of individual image processing results
+    Yields:
+        dict: Individual image processing result (see process_single_image)
     """
-    start_time = time.time()
-    
-    # Create cache manager if caching is enabled
-    cache_manager = CacheManager() if use_cache else None
+    # Workers open the cache themselves; only its directory is sent to them
+    cache_dir = (config or {}).get('cache_dir', '.cache') if use_cache else None
     
-    # Create output directory if specified
+    # Directories may have been removed since an earlier batch in this process
+    _ensured_dirs.clear()
     if output_dir is not None:
-        os.makedirs(output_dir, exist_ok=True)
+        _ensure_dir(output_dir)
     
-    # Filter out invalid image paths
-    valid_paths = [path for path in image_paths if os.path.isfile(path)]
-    if len(valid_paths) < len(image_paths):
-        logger.warning(f"Skipping {len(image_paths) - len(valid_paths)} invalid file paths")
+    # Filter out invalid image paths. Deduplication needs every path up front;
+    # streamed paths are checked where they are processed
+    dedup = bool(config and config.get('dedup'))
+    streamed = not isinstance(image_paths, (list, tuple)) and not dedup
+    missing_paths = []
+    if streamed:
+        valid_paths = image_paths
+        total_images = None
+    else:
+        valid_paths = list(_iter_existing_files(image_paths, missing_paths))
+        total_images = len(valid_paths)
+        if missing_paths:
+            logger.warning(f"Skipping {len(missing_paths)} invalid file paths")
     
-    total_images = len(valid_paths)
-    results = []
+    # Only the first of several byte-identical images is dispatched
+    duplicates = {}
+    if dedup:
+        valid_paths, duplicates = _group_duplicates(valid_paths)
+        total_images = len(valid_paths)
+        if duplicates:
+            logger.info(f"Found {sum(len(paths) for paths in duplicates.values())} duplicate images")
+    expand = partial(
+        _duplicate_results,
+        duplicates=duplicates,
+        num_colors=num_colors,
+        output_dir=output_dir,
+        generate_pdf=generate_pdf,
+        generate_text=generate_text,
+        config=config
+    )
     
-    logger.info(f"Processing {total_images} images with {max_workers or 'auto'} workers")
+    logger.info(f"Processing {total_images if total_images is not None else 'streamed'} images "
+                f"with {max_workers or 'auto'} workers")
     
     # If emotional analysis is enabled, log it
     if config and config.get('emotional_analysis'):
         logger.info("Emotional analysis is enabled")
     
-    # Process images in parallel using ProcessPoolExecutor
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all jobs
-        future_to_path = {
-            executor.submit(
-                process_single_image, 
+    if max_workers == 1 or (total_images is not None and total_images <= 1):
+        # A single worker gains nothing from a process pool but its startup
+        # and pickling costs, so process the images in this process
+        cache_manager = _cache_manager(cache_dir, config)
+        if streamed:
+            valid_paths = _iter_existing_files(valid_paths, missing_paths)
+        for path in _progress(valid_paths, total_images):
+            result = process_single_image(
                 path, 
                 num_colors, 
                 output_dir, 
@@ -212,40 +569,154 @@ def process_images(image_paths, num_colors=6, output_dir=None,
                 generate_text, 
                 cache_manager,
                 config
-            ): path for path in valid_paths
-        }
+            )
+            yield result
+            yield from expand(result)
+    else:
+        # Process images in parallel using ProcessPoolExecutor. Paths are sent
+        # in chunks, a few per worker, to keep the per-task IPC overhead low
+        workers = max_workers or os.cpu_count() or 1
+        if total_images is not None:
+            chunksize = max(1, total_images // (workers * _TASKS_PER_WORKER))
+        else:
+            chunksize = _STREAM_CHUNKSIZE
+        process_paths = partial(
+            _process_chunk,
+            num_colors=num_colors,
+            output_dir=output_dir,
+            generate_pdf=generate_pdf,
+            generate_text=generate_text,
+            cache_manager=None
+        )
+        chunks = _chunks(valid_paths, chunksize)
         
-        # Process results as they complete with progress bar
-        for future in tqdm(as_completed(future_to_path), total=total_images, desc="Processing images"):
+        # Tasks in flight as (paths, future, is_duplicate) triples, in the
+        # order results are yielded
+        pending = deque()
+        current_paths = []
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(cache_dir, config)) as executor, \
+                _progress(None, total_images) as progress_bar:
             try:
-                result = future.result()
-                results.append(result)
+                for chunk in itertools.islice(chunks, workers * _TASKS_PER_WORKER):
+                    pending.append((chunk, executor.submit(process_paths, chunk, skip_missing=streamed), False))
+                
+                while pending:
+                    current_paths, future, is_duplicate = pending.popleft()
+                    chunk_results = future.result()
+                    
+                    # Keep the workers busy before handing results out
+                    for chunk in itertools.islice(chunks, 1):
+                        pending.append((chunk, executor.submit(process_paths, chunk, skip_missing=streamed), False))
+                    
+                    # Copies of successfully processed images are rendered
+                    # next, in parallel, from the palette of the first copy
+                    # (a skipped first copy has none; its copies look it up)
+                    duplicate_tasks = [
+                        ([path], executor.submit(process_paths, [path], palette=result.get('palette')), True)
+                        for result in chunk_results if result is not None and result['success']
+                        for path in duplicates.get(result['image_path'], ())
+                    ]
+                    pending.extendleft(reversed(duplicate_tasks))
+                    
+                    paths, current_paths = current_paths, []
+                    for path, result in zip(paths, chunk_results):
+                        if result is None:
+                            missing_paths.append(path)
+                            continue
+                        # Like the serial loop, the bar counts first copies only
+                        if not is_duplicate:
+                            progress_bar.update(1)
+                        yield result
+                        if not result['success']:
+                            yield from expand(result)
             except Exception as e:
-                path = future_to_path[future]
-                logger.error(f"Unhandled exception processing {path}: {str(e)}")
+                logger.error(f"Unhandled exception in worker pool: {str(e)}")
                 logger.debug(traceback.format_exc())
                 
-                results.append({
-                    'image_path': path,
-                    'success': False,
-                    'error': str(e),
-                    'output_files': [],
-                    'processing_time': 0
-                })
+                # Report every image whose result was not yielded as failed:
+                # the task that raised, the tasks in flight and the paths not
+                # yet submitted
+                unfinished = itertools.chain(
+                    current_paths,
+                    itertools.chain.from_iterable(paths for paths, _, _ in pending),
+                    itertools.chain.from_iterable(chunks)
+                )
+                if streamed:
+                    unfinished = _iter_existing_files(unfinished, missing_paths)
+                for path in unfinished:
+                    result = _failed_result(path, str(e))
+                    yield result
+                    yield from expand(result)
+    
+    if missing_paths and streamed:
+        logger.warning(f"Skipped {len(missing_paths)} invalid file paths")
+
+def process_images(image_paths, num_colors=6, output_dir=None, 
+                 generate_pdf=True, generate_text=True, 
+                 use_cache=True, max_workers=None, config=None):
+    """Process multiple images in parallel.
+    
+    Args:
+        image_paths (list): List of image file paths
+        num_colors (int): Number of colors to extract
+        output_dir (str, optional): Directory to save output files
+        generate_pdf (bool): Whether to generate PDF reports
+        generate_text (bool): Whether to generate text files
+        use_cache (bool): Whether to use caching
+        max_workers (int, optional): Maximum number of worker processes
+        config (dict, optional): Configuration options
+            
+    Returns:
+        dict: Processing results summary with keys:
+            - total: Total number of images
+            - successful: Number of successfully processed images
+            - failed: Number of failed images
+            - processing_time: Total processing time in seconds
+            - results: List of individual image processing results
+    """
+    start_time = time.time()
+    
+    # Collect results and tally failures in a single pass
+    results = []
+    failed_results = []
+    image_times = []
+    for result in iter_process_images(
+        image_paths, 
+        num_colors, 
+        output_dir, 
+        generate_pdf, 
+        generate_text, 
+        use_cache, 
+        max_workers, 
+        config
+    ):
+        results.append(result)
+        if result['success']:
+            image_times.append(result['processing_time'])
+        else:
+            failed_results.append(result)
     
     # Calculate summary statistics
-    successful = sum(1 for r in results if r['success'])
-    failed = sum(1 for r in results if not r['success'])
+    total_images = len(results)
+    failed = len(failed_results)
+    successful = total_images - failed
     total_time = time.time() - start_time
     
     logger.info(f"Processed {total_images} images in {total_time:.2f} seconds")
     logger.info(f"Successful: {successful}, Failed: {failed}")
     
+    # Per-image timings are logged at DEBUG; summarize them here instead
+    if len(image_times) >= 2:
+        image_times.sort()
+        last = len(image_times) - 1
+        logger.info(f"Per-image time: p50 {image_times[round(last * 0.5)]:.2f}s, "
+                    f"p95 {image_times[round(last * 0.95)]:.2f}s, max {image_times[-1]:.2f}s")
+    
     if failed > 0:
         logger.warning("Failed images:")
-        for result in results:
-            if not result['success']:
-                logger.warning(f"  {result['image_path']}: {result.get('error', 'Unknown error')}")
+        for result in failed_results:
+            logger.warning(f"  {result['image_path']}: {result.get('error', 'Unknown error')}")
     
     return {
         'total': total_images,
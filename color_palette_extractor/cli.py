@@ -134,6 +134,21 @@ def parse_arguments():
         action="store_true",
         help="Disable caching of results"
     )
+    parser.add_argument(
+        "--cache-by-content",
+        action="store_true",
+        help="Key cached palettes by file contents, so copied or moved images reuse them"
+    )
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Skip images whose output files are newer than the image (directory and file list modes)"
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Analyze byte-identical images only once (directory and file list modes)"
+    )
     
     # NEW: Emotional analysis option
     parser.add_argument(
@@ -193,6 +208,7 @@ def main():
     # Determine output formats
     generate_pdf = not args.text_only
     generate_text = not args.pdf_only
+    cache_key_mode = "hash" if args.cache_by_content else "mtime"
     
     # Process based on input type
     try:
@@ -210,10 +226,18 @@ def main():
                 return 1
             
             # Create cache manager if enabled
-            cache_manager = None if args.no_cache else CacheManager()
+            cache_manager = None if args.no_cache else CacheManager(key_mode=cache_key_mode)
             
-            # Extract color palette
-            color_palette = extract_color_palette(image_path, args.num_colors)
+            # Extract color palette, unless an earlier run cached it
+            color_palette = None
+            image_stat = None
+            if cache_manager is not None:
+                image_stat = os.stat(image_path)
+                color_palette = cache_manager.get_cached_result(image_path, args.num_colors, image_stat)
+            if color_palette is None:
+                color_palette = extract_color_palette(image_path, args.num_colors)
+                if cache_manager is not None:
+                    cache_manager.store_result(image_path, args.num_colors, color_palette, image_stat)
             
             # Generate harmonies
             harmonies = get_harmonies(color_palette)
@@ -275,7 +299,10 @@ def main():
             
             # Create config dictionary for batch processing
             config = {
-                "emotional_analysis": args.emotional_analysis
+                "emotional_analysis": args.emotional_analysis,
+                "skip_existing": args.skip_existing,
+                "dedup": args.dedup,
+                "cache_key_mode": cache_key_mode
             }
             
             # Process the directory
@@ -310,32 +337,30 @@ def main():
                 logger.error(f"File list not found: {list_path}")
                 return 1
             
-            # Read image paths from file
-            with open(list_path, 'r') as f:
-                image_paths = [line.strip() for line in f if line.strip()]
-            
-            if not image_paths:
-                logger.warning("No image paths found in file list")
-                return 0
-            
-            logger.info(f"Found {len(image_paths)} image paths in list")
-            
             # Create config dictionary for batch processing
             config = {
-                "emotional_analysis": args.emotional_analysis
+                "emotional_analysis": args.emotional_analysis,
+                "skip_existing": args.skip_existing,
+                "dedup": args.dedup,
+                "cache_key_mode": cache_key_mode
             }
             
-            # Process the images
-            result = process_images(
-                image_paths,
-                num_colors=args.num_colors,
-                output_dir=args.output_dir,
-                generate_pdf=generate_pdf,
-                generate_text=generate_text,
-                use_cache=not args.no_cache,
-                max_workers=args.jobs,
-                config=config
-            )
+            # Stream image paths from the file straight into the workers
+            with open(list_path, 'r') as f:
+                result = process_images(
+                    (line.strip() for line in f if line.strip()),
+                    num_colors=args.num_colors,
+                    output_dir=args.output_dir,
+                    generate_pdf=generate_pdf,
+                    generate_text=generate_text,
+                    use_cache=not args.no_cache,
+                    max_workers=args.jobs,
+                    config=config
+                )
+            
+            if result['total'] == 0:
+                logger.warning("No valid image paths found in file list")
+                return 0
             
             logger.info(f"Processed {result['total']} images in {result['processing_time']:.2f} seconds")
             logger.info(f"Successful: {result['successful']}, Failed: {result['failed']}")
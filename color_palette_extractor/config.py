@@ -6,8 +6,10 @@ Configuration management for the Color Palette Extractor.
 """
 
 import os
+import copy
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -43,6 +45,20 @@ DEFAULT_CONFIG = {
     }
 }
 
+@lru_cache(maxsize=8)
+def _read_config_file(config_path, mtime):
+    """Parse a configuration file, memoized on its path and modification time.
+    
+    Args:
+        config_path (str): Path to configuration file
+        mtime (float): Modification time of the file, so edits invalidate the cache
+        
+    Returns:
+        dict: Parsed configuration, shared between cache hits
+    """
+    with open(config_path, 'r') as f:
+        return json.load(f)
+
 class ConfigManager:
     """Manages configuration for the color palette extractor."""
     
@@ -64,21 +80,21 @@ class ConfigManager:
         """
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    config = json.load(f)
+                mtime = os.path.getmtime(self.config_path)
+                config = copy.deepcopy(_read_config_file(self.config_path, mtime))
                 logger.info(f"Loaded configuration from {self.config_path}")
                 
                 # Merge with default config to ensure all keys exist
-                merged_config = DEFAULT_CONFIG.copy()
+                merged_config = copy.deepcopy(DEFAULT_CONFIG)
                 self._deep_update(merged_config, config)
                 return merged_config
             else:
                 logger.info(f"No configuration file found at {self.config_path}, using defaults")
-                return DEFAULT_CONFIG.copy()
+                return copy.deepcopy(DEFAULT_CONFIG)
         except Exception as e:
             logger.error(f"Error loading configuration: {str(e)}")
             logger.warning("Using default configuration")
-            return DEFAULT_CONFIG.copy()
+            return copy.deepcopy(DEFAULT_CONFIG)
     
     def _deep_update(self, target, source):
         """Recursively update nested dictionaries.
@@ -216,7 +232,7 @@ class ConfigManager:
             bool: True if successful, False otherwise
         """
         try:
-            self.config = DEFAULT_CONFIG.copy()
+            self.config = copy.deepcopy(DEFAULT_CONFIG)
             logger.info("Reset configuration to defaults")
             return True
         except:
@@ -6,21 +6,27 @@ Core functionality for extracting color palettes from images.
 """
 
 import numpy as np
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from PIL import Image as PILImage
 import logging
 
-from color_palette_extractor.utils.color import rgb_to_cmyk
+from color_palette_extractor.utils.color import rgb_to_cmyk_array
+from color_palette_extractor.utils.image import resize_for_processing, ensure_rgb
 
 logger = logging.getLogger(__name__)
 
-def extract_color_palette(image_path, num_colors=6, max_dimension=1000):
+# Images with more pixels are clustered on a fixed random sample of this size
+MAX_CLUSTER_PIXELS = 50000
+
+def extract_color_palette(image_path, num_colors=6, max_dimension=1000, use_minibatch=True):
     """Extract a color palette from an image using KMeans clustering.
     
     Args:
         image_path (str): Path to the image file
         num_colors (int): Number of colors to extract (1-12)
         max_dimension (int): Maximum dimension for image processing
+        use_minibatch (bool): Whether to cluster with MiniBatchKMeans, which is
+            much faster on large images; False runs exact full-batch KMeans
         
     Returns:
         list: List of tuples (hex_color, rgb_color, cmyk_color)
@@ -30,36 +36,47 @@ def extract_color_palette(image_path, num_colors=6, max_dimension=1000):
     try:
         img = PILImage.open(image_path)
         
-        # Calculate new dimensions
-        width, height = img.size
-        if max(width, height) > max_dimension:
-            scale_factor = max_dimension / max(width, height)
-            new_width = int(width * scale_factor)
-            new_height = int(height * scale_factor)
-            img = img.resize((new_width, new_height), PILImage.LANCZOS)
-        
-        # Convert image to RGB mode if it's not already
-        if img.mode != 'RGB':
-            img = img.convert('RGB')
+        # Downscale large images and convert them to RGB mode
+        img = ensure_rgb(resize_for_processing(img, max_dimension))
         
-        img_array = np.array(img)
+        # A read-only view of Pillow's pixel buffer, saving a copy of it
+        img_array = np.asarray(img)
 
         # Reshape to a list of pixels
         img_pixels = img_array.reshape((-1, 3))
+        
+        # Dominant colors survive uniform subsampling, so cluster a sample
+        if img_pixels.shape[0] > MAX_CLUSTER_PIXELS:
+            idx = np.random.default_rng(42).choice(img_pixels.shape[0], MAX_CLUSTER_PIXELS, replace=False)
+            img_pixels = img_pixels[idx]
 
         # Apply KMeans clustering
-        kmeans = KMeans(n_clusters=num_colors, n_init=10, random_state=42)
-        kmeans.fit(img_pixels)
+        if use_minibatch:
+            kmeans = MiniBatchKMeans(n_clusters=num_colors, batch_size=4096, n_init=3, max_iter=100,
+                                     random_state=42, reassignment_ratio=0.01)
+        else:
+            kmeans = KMeans(n_clusters=num_colors, n_init=10, random_state=42)
+        # Cluster each distinct color once, weighted by its pixel count;
+        # flat graphics shrink to a handful of points. Images with fewer
+        # distinct colors than clusters are fitted on the pixels as before
+        codes = ((img_pixels[:, 0].astype(np.uint32) << 16)
+                 | (img_pixels[:, 1].astype(np.uint32) << 8) | img_pixels[:, 2])
+        unique_codes, counts = np.unique(codes, return_counts=True)
+        if len(unique_codes) >= num_colors:
+            unique_pixels = np.column_stack((unique_codes >> 16, (unique_codes >> 8) & 255,
+                                             unique_codes & 255))
+            kmeans.fit(unique_pixels, sample_weight=counts)
+        else:
+            kmeans.fit(img_pixels)
 
         # Get the cluster centers (dominant colors)
         dominant_colors = kmeans.cluster_centers_.astype(int)
 
-        # Convert to desired formats
+        # Convert to desired formats, all CMYK values in one pass
         color_palette = []
-        for color in dominant_colors:
+        for color, cmyk_color in zip(dominant_colors, rgb_to_cmyk_array(dominant_colors)):
             hex_color = '#{:02x}{:02x}{:02x}'.format(*color)
             rgb_color = tuple(color)
-            cmyk_color = rgb_to_cmyk(*color)
             color_palette.append((hex_color, rgb_color, cmyk_color))
             
         logger.debug(f"Extracted {len(color_palette)} colors from {image_path}")
@@ -11,6 +11,7 @@ import logging
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
 import threading
+from collections import OrderedDict
 from datetime import datetime
 from PIL import Image, ImageTk
 
@@ -39,6 +40,30 @@ else:
 
 logger = logging.getLogger(__name__)
 
+def _folder_signature(folder_path, recursive):
+    """Collect the modification times of a folder and, if recursive, its subfolders.
+    
+    Adding, removing or renaming a file changes its folder's modification time,
+    so an unchanged signature means an earlier image scan is still current.
+    Only directories are listed, which is far cheaper than validating images.
+    
+    Args:
+        folder_path (str): Path to the folder
+        recursive (bool): Whether subfolders are included
+        
+    Returns:
+        tuple: Sorted (path, st_mtime_ns) pairs of the scanned folders
+    """
+    signature = []
+    pending = [folder_path]
+    while pending:
+        path = pending.pop()
+        signature.append((path, os.stat(path).st_mtime_ns))
+        if recursive:
+            with os.scandir(path) as entries:
+                pending.extend(entry.path for entry in entries if entry.is_dir(follow_symlinks=False))
+    return tuple(sorted(signature))
+
 class ColorPaletteExtractorGUI:
     """Graphical user interface for the Color Palette Extractor."""
     
@@ -66,6 +91,8 @@ class ColorPaletteExtractorGUI:
         self.generate_text = tk.BooleanVar(value=self.config_manager.get('generate_text', True))
         self.processing = False
         self.preview_image = None
+        self.preview_cache = OrderedDict()  # Recent previews, keyed by file and canvas size
+        self.image_list_cache = None  # (folder, recursive, signature, image paths) of the last scan
         
         # Create GUI elements
         self.create_widgets()
@@ -230,16 +257,36 @@ class ColorPaletteExtractorGUI:
             self.log_message(f"Selected folder: {folder_path}")
             
             # Count images in folder
-            image_count = len(find_images_in_directory(
-                folder_path, 
-                recursive=self.recursive.get()
-            ))
+            image_count = len(self.find_images(folder_path, self.recursive.get()))
             
             if image_count > 0:
                 self.log_message(f"Found {image_count} images in folder")
             else:
                 self.log_message("No valid images found in folder")
     
+    def find_images(self, folder_path, recursive):
+        """Find the valid images of a folder, reusing the last scan if still current.
+        
+        Args:
+            folder_path (str): Path to the folder
+            recursive (bool): Whether to search recursively
+            
+        Returns:
+            list: List of paths to valid image files
+        """
+        try:
+            signature = _folder_signature(folder_path, recursive)
+        except OSError:
+            return find_images_in_directory(folder_path, recursive=recursive)
+        
+        key = (folder_path, recursive, signature)
+        if self.image_list_cache is not None and self.image_list_cache[:3] == key:
+            return list(self.image_list_cache[3])
+        
+        image_paths = find_images_in_directory(folder_path, recursive=recursive)
+        self.image_list_cache = key + (image_paths,)
+        return list(image_paths)
+    
     def select_output_folder(self):
         """Open folder dialog to select output folder."""
         folder_path = filedialog.askdirectory(title="Select Output Folder")
@@ -260,23 +307,38 @@ class ColorPaletteExtractorGUI:
             return
         
         try:
-            # Open and resize image for preview
-            img = Image.open(image_path)
-            
             # Calculate resize dimensions to fit canvas
             canvas_width = self.preview_canvas.winfo_width() or 300
             canvas_height = self.preview_canvas.winfo_height() or 300
             
-            # Resize image to fit canvas while maintaining aspect ratio
-            width, height = img.size
-            ratio = min(canvas_width / width, canvas_height / height)
-            new_width = int(width * ratio)
-            new_height = int(height * ratio)
-            
-            img = img.resize((new_width, new_height), Image.LANCZOS)
-            
-            # Convert to PhotoImage for display
-            photo_img = ImageTk.PhotoImage(img)
+            # Reuse the preview of a recently shown file if it has not changed
+            cache_key = (image_path, os.path.getmtime(image_path), canvas_width, canvas_height)
+            photo_img = self.preview_cache.get(cache_key)
+            if photo_img is not None:
+                self.preview_cache.move_to_end(cache_key)
+            else:
+                # Open and resize image for preview
+                img = Image.open(image_path)
+                
+                # Resize image to fit canvas while maintaining aspect ratio
+                width, height = img.size
+                ratio = min(canvas_width / width, canvas_height / height)
+                new_width = int(width * ratio)
+                new_height = int(height * ratio)
+                
+                if ratio < 1:
+                    # Let JPEGs decode at a reduced scale, then shrink in place
+                    img.draft('RGB', (new_width * 2, new_height * 2))
+                    img.thumbnail((new_width, new_height), Image.LANCZOS)
+                else:
+                    img = img.resize((new_width, new_height), Image.LANCZOS)
+                
+                # Convert to PhotoImage for display
+                photo_img = ImageTk.PhotoImage(img)
+                
+                self.preview_cache[cache_key] = photo_img
+                if len(self.preview_cache) > 8:
+                    self.preview_cache.popitem(last=False)
             
             # Clear previous image and display new one
             self.preview_canvas.delete("all")
@@ -405,7 +467,7 @@ Project website: https://github.com/MichailSemoglou/color-palette-extractor
                     raise ValueError(f"Directory not found: {input_path}")
                 
                 # Find images
-                image_paths = find_images_in_directory(input_path, recursive=recursive)
+                image_paths = self.find_images(input_path, recursive)
                 
                 if not image_paths:
                     raise ValueError(f"No valid images found in directory: {input_path}")
@@ -5,11 +5,28 @@
 Color harmony generation functionality for the Color Palette Extractor.
 """
 
-import colorsys
 import logging
+from functools import lru_cache
+
+import numpy as np
+
+from color_palette_extractor.utils.color import rgb_to_hsv_array, hsv_to_rgb_array
 
 logger = logging.getLogger(__name__)
 
+# Harmonies built by rotating the hue: entry labels and their hue offsets
+_HUE_SHIFT_HARMONIES = {
+    "complementary": (("Complement",), (0.5,)),
+    "analogous": (("Analog 1", "Analog 2"), (1/12, -1/12)),
+    "triadic": (("Triad 1", "Triad 2"), (1/3, 2/3)),
+    "tetradic": (("Tetra 1", "Tetra 2", "Tetra 3"), (0.25, 0.5, 0.75)),
+}
+
+# Tint and shade steps, as fractions of the way to white or black
+_STEPS = np.arange(5) / 4
+_TINT_LABELS = tuple(f"Tint {i+1}" for i in range(5))
+_SHADE_LABELS = tuple(f"Shade {i+1}" for i in range(5))
+
 def rgb_to_hex(rgb):
     """Convert RGB tuple to HEX string.
     
@@ -19,7 +36,22 @@ def rgb_to_hex(rgb):
     Returns:
         str: Hex color string (#RRGGBB)
     """
-    return '#{:02x}{:02x}{:02x}'.format(*rgb)
+    # bytes() would read an array's raw buffer rather than its values
+    if isinstance(rgb, np.ndarray):
+        rgb = rgb.tolist()
+    return '#' + bytes(rgb).hex()
+
+def rgb_to_hex_array(rgb):
+    """Convert a batch of RGB colors to HEX strings.
+    
+    Args:
+        rgb (array-like): RGB colors with a trailing axis of 3, values 0-255
+        
+    Returns:
+        list: Hex color strings (#RRGGBB) in row-major order
+    """
+    hex_digits = np.asarray(rgb).astype(np.uint8).tobytes().hex()
+    return ['#' + hex_digits[i:i+6] for i in range(0, len(hex_digits), 6)]
 
 def is_dark(hex_color):
     """Determine if a color is dark based on its luminance.
@@ -35,6 +67,22 @@ def is_dark(hex_color):
     luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
     return luminance < 0.5
 
+def is_dark_array(rgb):
+    """Determine which colors of a batch are dark based on their luminance.
+    
+    Evaluates the same expression as is_dark, so results match it exactly.
+    
+    Args:
+        rgb (array-like): RGB colors with a trailing axis of 3, values 0-255
+        
+    Returns:
+        numpy.ndarray: Boolean array, True where the color is dark
+    """
+    rgb = np.asarray(rgb, dtype=np.float64)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
+    return luminance < 0.5
+
 def get_harmonies(color_palette, harmony_types=None):
     """Generate common color harmonies based on the palette.
     
@@ -52,80 +100,72 @@ def get_harmonies(color_palette, harmony_types=None):
     # If harmony_types is None, use all types
     harmony_types = harmony_types or all_harmony_types
     
+    logger.debug(f"Generating {len(harmony_types)} harmony types for {len(color_palette)} colors")
+    
+    # Harmonies depend only on the RGB values, so identical palettes are
+    # generated once; callers still get their own containers
+    palette_key = tuple(tuple(int(val) for val in color[1]) for color in color_palette)
+    cached = _get_harmonies(palette_key, tuple(harmony_types))
+    return {
+        harmony_type: [dict(entry) for entry in entries]
+        for harmony_type, entries in cached.items()
+    }
+
+@lru_cache(maxsize=512)
+def _get_harmonies(palette_key, harmony_types):
+    """Generate color harmonies for a palette given as a tuple of RGB tuples.
+    
+    Args:
+        palette_key (tuple): RGB tuple (r, g, b) for each palette color
+        harmony_types (tuple): Harmony types to generate
+    
+    Returns:
+        dict: Dictionary of color harmonies, shared between cache hits
+    """
     # Initialize harmonies dictionary
     harmonies = {harmony_type: [] for harmony_type in harmony_types}
+    if not palette_key:
+        return harmonies
     
-    logger.debug(f"Generating {len(harmony_types)} harmony types for {len(color_palette)} colors")
+    # Lay out every variant of every requested harmony as a column of
+    # (N, M) hue, saturation and value arrays, one row per palette color
+    hsv = rgb_to_hsv_array(palette_key)
+    h, s, v = hsv[:, :1], hsv[:, 1:2], hsv[:, 2:]
+    blocks = []
+    for harmony_type in harmony_types:
+        if harmony_type in _HUE_SHIFT_HARMONIES:
+            labels, offsets = _HUE_SHIFT_HARMONIES[harmony_type]
+            block = ((h + np.array(offsets)) % 1, s, v)
+        elif harmony_type == "tints":
+            labels = _TINT_LABELS
+            block = (h, np.maximum(0, s - (s * _STEPS)), np.minimum(1, v + ((1 - v) * _STEPS)))
+        elif harmony_type == "shades":
+            labels = _SHADE_LABELS
+            block = (h, s, v * (1 - _STEPS))
+        else:
+            continue
+        blocks.append((harmony_type, labels, np.broadcast_arrays(*block)))
     
-    for color in color_palette:
-        rgb = color[1]
-        h, s, v = colorsys.rgb_to_hsv(rgb[0]/255, rgb[1]/255, rgb[2]/255)
-
-        # Complementary
-        if "complementary" in harmony_types:
-            comp_h = (h + 0.5) % 1
-            comp_rgb = colorsys.hsv_to_rgb(comp_h, s, v)
-            harmonies["complementary"].append({
-                "Base": rgb_to_hex(rgb),
-                "Complement": rgb_to_hex(tuple(int(x*255) for x in comp_rgb))
-            })
-
-        # Analogous
-        if "analogous" in harmony_types:
-            analog_h1 = (h + 1/12) % 1
-            analog_h2 = (h - 1/12) % 1
-            analog_rgb1 = colorsys.hsv_to_rgb(analog_h1, s, v)
-            analog_rgb2 = colorsys.hsv_to_rgb(analog_h2, s, v)
-            harmonies["analogous"].append({
-                "Base": rgb_to_hex(rgb),
-                "Analog 1": rgb_to_hex(tuple(int(x*255) for x in analog_rgb1)),
-                "Analog 2": rgb_to_hex(tuple(int(x*255) for x in analog_rgb2))
-            })
-
-        # Triadic
-        if "triadic" in harmony_types:
-            triad_h1 = (h + 1/3) % 1
-            triad_h2 = (h + 2/3) % 1
-            triad_rgb1 = colorsys.hsv_to_rgb(triad_h1, s, v)
-            triad_rgb2 = colorsys.hsv_to_rgb(triad_h2, s, v)
-            harmonies["triadic"].append({
-                "Base": rgb_to_hex(rgb),
-                "Triad 1": rgb_to_hex(tuple(int(x*255) for x in triad_rgb1)),
-                "Triad 2": rgb_to_hex(tuple(int(x*255) for x in triad_rgb2))
-            })
-
-        # Tetradic
-        if "tetradic" in harmony_types:
-            tetra_h1 = (h + 0.25) % 1
-            tetra_h2 = (h + 0.5) % 1
-            tetra_h3 = (h + 0.75) % 1
-            tetra_rgb1 = colorsys.hsv_to_rgb(tetra_h1, s, v)
-            tetra_rgb2 = colorsys.hsv_to_rgb(tetra_h2, s, v)
-            tetra_rgb3 = colorsys.hsv_to_rgb(tetra_h3, s, v)
-            harmonies["tetradic"].append({
-                "Base": rgb_to_hex(rgb),
-                "Tetra 1": rgb_to_hex(tuple(int(x*255) for x in tetra_rgb1)),
-                "Tetra 2": rgb_to_hex(tuple(int(x*255) for x in tetra_rgb2)),
-                "Tetra 3": rgb_to_hex(tuple(int(x*255) for x in tetra_rgb3))
-            })
-
-        # Tints
-        if "tints" in harmony_types:
-            tints = []
-            for i in range(5):
-                tint_s = max(0, s - (s * (i / 4)))
-                tint_v = min(1, v + ((1 - v) * (i / 4)))
-                tint_rgb = colorsys.hsv_to_rgb(h, tint_s, tint_v)
-                tints.append(rgb_to_hex(tuple(int(x*255) for x in tint_rgb)))
-            harmonies["tints"].append({f"Tint {i+1}": tint for i, tint in enumerate(tints)})
-
-        # Shades
-        if "shades" in harmony_types:
-            shades = []
-            for i in range(5):
-                shade_v = v * (1 - i / 4)
-                shade_rgb = colorsys.hsv_to_rgb(h, s, shade_v)
-                shades.append(rgb_to_hex(tuple(int(x*255) for x in shade_rgb)))
-            harmonies["shades"].append({f"Shade {i+1}": shade for i, shade in enumerate(shades)})
+    if not blocks:
+        return harmonies
+    
+    # Convert all variants at once; int(x*255) truncation matches astype
+    hue, sat, val = (np.concatenate([block[i] for _, _, block in blocks], axis=1) for i in range(3))
+    rgb = (hsv_to_rgb_array(hue, sat, val) * 255).astype(np.uint8)
+    num_variants = rgb.shape[1]
+    hex_colors = rgb_to_hex_array(rgb)
+    base_colors = rgb_to_hex_array(palette_key)
+    
+    # Only a small loop building the entry dicts remains
+    column = 0
+    for harmony_type, labels, _ in blocks:
+        entries = harmonies[harmony_type]
+        with_base = harmony_type in _HUE_SHIFT_HARMONIES
+        for row, base_color in enumerate(base_colors):
+            start = row * num_variants + column
+            entry = {"Base": base_color} if with_base else {}
+            entry.update(zip(labels, hex_colors[start:start + len(labels)]))
+            entries.append(entry)
+        column += len(labels)
 
     return harmonies
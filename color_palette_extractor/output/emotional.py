@@ -5,6 +5,7 @@
 Emotional analysis output for the Color Palette Extractor.
 """
 
+import io
 import os
 import json
 import logging
@@ -25,31 +26,35 @@ def save_emotional_analysis(analysis_results, filename="color_emotions.txt"):
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
         
+        # Build the report in memory and write it in one call
+        buf = io.StringIO()
+        buf.write("COLOR PALETTE EMOTIONAL ANALYSIS\n")
+        buf.write("===============================\n\n")
+        
+        # Overall analysis
+        buf.write("OVERALL PALETTE ANALYSIS:\n")
+        buf.write("-----------------------\n")
+        buf.write(f"Dominant Emotions: {', '.join(analysis_results['overall']['dominant_emotions'])}\n\n")
+        buf.write(f"Harmony Analysis: {analysis_results['overall']['harmony_analysis']}\n\n")
+        buf.write(f"Brand Recommendations: {analysis_results['overall']['brand_recommendations']}\n\n")
+        
+        # Individual colors
+        buf.write("INDIVIDUAL COLOR ANALYSIS:\n")
+        buf.write("------------------------\n")
+        for i, color in enumerate(analysis_results['colors']):
+            buf.write(f"Color {i+1} ({color['hex']}, {color['color_name'].capitalize()}):\n")
+            buf.write(f"  Emotional Response: {', '.join(color['emotions'])}\n")
+            buf.write(f"  Associations: {', '.join(color['associations'])}\n")
+            buf.write(f"  Intensity: {color['intensity'].capitalize()}\n")
+            buf.write(f"  Brand Fit: {', '.join(color['brand_fit'])}\n\n")
+        
         with open(filename, 'w') as f:
-            f.write("COLOR PALETTE EMOTIONAL ANALYSIS\n")
-            f.write("===============================\n\n")
-            
-            # Overall analysis
-            f.write("OVERALL PALETTE ANALYSIS:\n")
-            f.write("-----------------------\n")
-            f.write(f"Dominant Emotions: {', '.join(analysis_results['overall']['dominant_emotions'])}\n\n")
-            f.write(f"Harmony Analysis: {analysis_results['overall']['harmony_analysis']}\n\n")
-            f.write(f"Brand Recommendations: {analysis_results['overall']['brand_recommendations']}\n\n")
-            
-            # Individual colors
-            f.write("INDIVIDUAL COLOR ANALYSIS:\n")
-            f.write("------------------------\n")
-            for i, color in enumerate(analysis_results['colors']):
-                f.write(f"Color {i+1} ({color['hex']}, {color['color_name'].capitalize()}):\n")
-                f.write(f"  Emotional Response: {', '.join(color['emotions'])}\n")
-                f.write(f"  Associations: {', '.join(color['associations'])}\n")
-                f.write(f"  Intensity: {color['intensity'].capitalize()}\n")
-                f.write(f"  Brand Fit: {', '.join(color['brand_fit'])}\n\n")
+            f.write(buf.getvalue())
         
         # Also save as JSON for potential future use
         json_filename = os.path.splitext(filename)[0] + ".json"
         with open(json_filename, 'w') as f:
-            json.dump(analysis_results, f, indent=2)
+            f.write(json.dumps(analysis_results, indent=2))
         
         logger.info(f"Saved emotional analysis to {filename} and {json_filename}")
         return filename
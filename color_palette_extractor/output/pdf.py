@@ -5,32 +5,123 @@
 PDF report generation for the Color Palette Extractor 2.0
 """
 
+import io
 import os
 import logging
+import numpy as np
 from PIL import Image as PILImage
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
 from reportlab.platypus import Image as ReportLabImage
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.enums import TA_LEFT, TA_CENTER
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.units import inch
 
-from color_palette_extractor.harmonies import is_dark
+from color_palette_extractor.harmonies import is_dark_array
 from .. import FONTS_DIR
 
 logger = logging.getLogger(__name__)
 
-# Register fonts
-try:
-    pdfmetrics.registerFont(TTFont('Inter-Bold', os.path.join(FONTS_DIR, 'Inter-Bold.ttf')))
-    pdfmetrics.registerFont(TTFont('Inter-Regular', os.path.join(FONTS_DIR, 'Inter-Regular.ttf')))
-    FONTS_REGISTERED = True
-except:
-    logger.warning("Unable to register Inter fonts. Using default fonts instead.")
-    FONTS_REGISTERED = False
+# Fonts are registered and paragraph styles built for the first report, so
+# importing this module does not parse the font files
+FONTS_REGISTERED = None
+_BODY_FONT = None
+_PDF_STYLES = None
+
+def _get_pdf_styles():
+    """Register the Inter fonts and build the report styles on first use.
+    
+    Falls back to the standard Helvetica fonts if Inter cannot be registered.
+    
+    Returns:
+        tuple: (body font name, dict of paragraph styles keyed by role)
+    """
+    global FONTS_REGISTERED, _BODY_FONT, _PDF_STYLES
+    
+    if _PDF_STYLES is None:
+        try:
+            pdfmetrics.registerFont(TTFont('Inter-Bold', os.path.join(FONTS_DIR, 'Inter-Bold.ttf')))
+            pdfmetrics.registerFont(TTFont('Inter-Regular', os.path.join(FONTS_DIR, 'Inter-Regular.ttf')))
+            FONTS_REGISTERED = True
+        except Exception:
+            logger.warning("Unable to register Inter fonts. Using default fonts instead.")
+            FONTS_REGISTERED = False
+        
+        if FONTS_REGISTERED:
+            title_font, body_font = 'Inter-Bold', 'Inter-Regular'
+        else:
+            title_font, body_font = 'Helvetica-Bold', 'Helvetica'
+        
+        _BODY_FONT = body_font
+        _PDF_STYLES = {
+            'title': ParagraphStyle(name='Title', fontName=title_font, fontSize=18, 
+                                    leading=20, alignment=TA_LEFT, spaceAfter=10),
+            'heading': ParagraphStyle(name='Heading2', fontName=title_font, fontSize=14, 
+                                      leading=16, alignment=TA_LEFT, spaceBefore=16, spaceAfter=8),
+            'subheading': ParagraphStyle(name='Heading3', fontName=title_font, fontSize=12, 
+                                         leading=14, alignment=TA_LEFT, spaceBefore=12, spaceAfter=6),
+            'normal': ParagraphStyle(name='Normal', fontName=body_font, fontSize=10,
+                                     leading=12, alignment=TA_LEFT, spaceBefore=6, spaceAfter=6),
+            'color_name': ParagraphStyle(name='ColorName', fontName=title_font, fontSize=11,
+                                         leading=13, alignment=TA_LEFT, spaceBefore=10, spaceAfter=4),
+        }
+    
+    return _BODY_FONT, _PDF_STYLES
+
+def _embedded_image(img, image_filename, display_width, display_height):
+    """Get the image data to embed for the original image.
+    
+    Images larger than 3 pixels per point of their display size (216 dpi) are
+    downscaled to that resolution and re-encoded in memory, so the PDF does
+    not carry, and reportlab does not process, the full-resolution original.
+    
+    Args:
+        img (PIL.Image): Opened, not yet decoded original image
+        image_filename (str): Path of the original image
+        display_width (float): Display width in points
+        display_height (float): Display height in points
+        
+    Returns:
+        str or io.BytesIO: The original path, or the downscaled image data
+    """
+    embed_size = (max(1, int(display_width * 3)), max(1, int(display_height * 3)))
+    if img.width <= embed_size[0] and img.height <= embed_size[1]:
+        return image_filename
+    
+    img.draft('RGB', embed_size)
+    img.thumbnail(embed_size, PILImage.LANCZOS)
+    
+    buf = io.BytesIO()
+    if img.mode in ('RGBA', 'LA', 'P'):
+        # Keep transparency and palettes lossless
+        img.save(buf, format='PNG', optimize=True)
+    else:
+        if img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+        img.save(buf, format='JPEG', quality=85, optimize=True)
+    buf.seek(0)
+    return buf
+
+def _swatch_colors(hex_colors):
+    """Parse each distinct swatch color once and pick a readable text color for it.
+    
+    Args:
+        hex_colors (list): Hex color strings (#RRGGBB) of the swatches
+        
+    Returns:
+        dict: (fill color, white or black text color) reportlab color pairs
+            keyed by hex color
+    """
+    unique_colors = list(dict.fromkeys(hex_colors))
+    digits = bytes.fromhex(''.join(hex_color.lstrip('#') for hex_color in unique_colors))
+    dark = is_dark_array(np.frombuffer(digits, dtype=np.uint8).reshape(-1, 3))
+    return {
+        hex_color: (colors.HexColor(hex_color), colors.white if is_dark_color else colors.black)
+        for hex_color, is_dark_color in zip(unique_colors, dark)
+    }
 
 def save_palette_to_pdf(color_palette, harmonies, filename="color_palette.pdf", image_filename="", emotional_analysis=None, config=None):
     """Save the color palette and harmonies to a PDF file.
@@ -59,13 +150,8 @@ def save_palette_to_pdf(color_palette, harmonies, filename="color_palette.pdf",
     show_original_image = config.get('show_original_image', True)
     image_width = config.get('image_width', 3 * inch)
     
-    # Create fonts and styles
-    if FONTS_REGISTERED:
-        title_font = 'Inter-Bold'
-        body_font = 'Inter-Regular'
-    else:
-        title_font = 'Helvetica-Bold'
-        body_font = 'Helvetica'
+    # Fonts and styles are set up once per process, on the first report
+    body_font, pdf_styles = _get_pdf_styles()
     
     # Create the document
     if page_size == 'A4':
@@ -80,17 +166,11 @@ def save_palette_to_pdf(color_palette, harmonies, filename="color_palette.pdf",
     elements = []
     
     # Styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(name='Title', fontName=title_font, fontSize=18, 
-                                leading=20, alignment=TA_LEFT, spaceAfter=10)
-    heading_style = ParagraphStyle(name='Heading2', fontName=title_font, fontSize=14, 
-                                 leading=16, alignment=TA_LEFT, spaceBefore=16, spaceAfter=8)
-    subheading_style = ParagraphStyle(name='Heading3', fontName=title_font, fontSize=12, 
-                                    leading=14, alignment=TA_LEFT, spaceBefore=12, spaceAfter=6)
-    normal_style = ParagraphStyle(name='Normal', fontName=body_font, fontSize=10,
-                                 leading=12, alignment=TA_LEFT, spaceBefore=6, spaceAfter=6)
-    color_name_style = ParagraphStyle(name='ColorName', fontName=title_font, fontSize=11,
-                                    leading=13, alignment=TA_LEFT, spaceBefore=10, spaceAfter=4)
+    title_style = pdf_styles['title']
+    heading_style = pdf_styles['heading']
+    subheading_style = pdf_styles['subheading']
+    normal_style = pdf_styles['normal']
+    color_name_style = pdf_styles['color_name']
     
     # Title
     title = f"Color Palette and Harmonies"
@@ -102,19 +182,30 @@ def save_palette_to_pdf(color_palette, harmonies, filename="color_palette.pdf",
     # Add the original image if requested
     if show_original_image and image_filename and os.path.exists(image_filename):
         try:
-            img = PILImage.open(image_filename)
-            img_width, img_height = img.size
-            aspect = img_height / float(img_width)
-            
-            # Calculate height based on aspect ratio
-            display_width = image_width
-            display_height = display_width * aspect
+            with PILImage.open(image_filename) as img:
+                img_width, img_height = img.size
+                aspect = img_height / float(img_width)
+                
+                # Calculate height based on aspect ratio
+                display_width = image_width
+                display_height = display_width * aspect
+                
+                image_source = _embedded_image(img, image_filename, display_width, display_height)
 
-            elements.append(ReportLabImage(image_filename, width=display_width, height=display_height))
+            elements.append(ReportLabImage(image_source, width=display_width, height=display_height))
             elements.append(Spacer(1, 0.2*inch))
         except Exception as e:
             logger.error(f"Error adding image to PDF: {str(e)}")
 
+    # Fill and text colors of every swatch in the report
+    swatch_colors = [color[0] for color in color_palette]
+    swatch_colors.extend(color_hex for harmony_sets in harmonies.values()
+                         for harmony_set in harmony_sets for color_hex in harmony_set.values())
+    if emotional_analysis:
+        swatch_colors.extend(color_info.get("hex", "#FFFFFF")
+                             for color_info in emotional_analysis.get("colors") or [])
+    swatches = _swatch_colors(swatch_colors)
+
     # Add color palette (in two rows)
     elements.append(Paragraph("Original Color Palette", heading_style))
     
@@ -130,21 +221,21 @@ def save_palette_to_pdf(color_palette, harmonies, filename="color_palette.pdf",
     # Create palette table
     palette_table = Table(palette_rows, colWidths=60, rowHeights=60)
     
-    palette_style = TableStyle([
+    palette_commands = [
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
         ('FONTNAME', (0, 0), (-1, -1), body_font),
         ('FONTSIZE', (0, 0), (-1, -1), 8),
-    ])
+    ]
     
-    # Set background color for each cell
+    # Set background and text color for each cell
     for row_idx, row in enumerate(palette_rows):
         for col_idx, hex_color in enumerate(row):
-            palette_style.add('BACKGROUND', (col_idx, row_idx), (col_idx, row_idx), colors.HexColor(hex_color))
-            text_color = colors.white if is_dark(hex_color) else colors.black
-            palette_style.add('TEXTCOLOR', (col_idx, row_idx), (col_idx, row_idx), text_color)
+            fill_color, text_color = swatches[hex_color]
+            palette_commands.append(('BACKGROUND', (col_idx, row_idx), (col_idx, row_idx), fill_color))
+            palette_commands.append(('TEXTCOLOR', (col_idx, row_idx), (col_idx, row_idx), text_color))
     
-    palette_table.setStyle(palette_style)
+    palette_table.setStyle(TableStyle(palette_commands))
     elements.append(palette_table)
 
     # Add emotional analysis if available
@@ -183,13 +274,14 @@ def save_palette_to_pdf(color_palette, harmonies, filename="color_palette.pdf",
                 brand_fit = ", ".join(color_info.get("brand_fit", []))
                 
                 # Create a colored box
+                fill_color, text_color = swatches[hex_color]
                 color_box_data = [[hex_color]]
                 color_box = Table(color_box_data, colWidths=[60], rowHeights=[30])
                 color_box.setStyle(TableStyle([
                     ('ALIGN', (0, 0), (0, 0), 'CENTER'),
                     ('VALIGN', (0, 0), (0, 0), 'MIDDLE'),
-                    ('BACKGROUND', (0, 0), (0, 0), colors.HexColor(hex_color)),
-                    ('TEXTCOLOR', (0, 0), (0, 0), colors.white if is_dark(hex_color) else colors.black),
+                    ('BACKGROUND', (0, 0), (0, 0), fill_color),
+                    ('TEXTCOLOR', (0, 0), (0, 0), text_color),
                     ('FONTNAME', (0, 0), (0, 0), body_font),
                     ('FONTSIZE', (0, 0), (0, 0), 8),
                     ('BOX', (0, 0), (0, 0), 1, colors.black),
@@ -208,6 +300,7 @@ def save_palette_to_pdf(color_palette, harmonies, filename="color_palette.pdf",
     if emotional_analysis:
         harmony_pages.append("Emotional Analysis")
         
+    last_harmony_type = list(harmonies)[-1] if harmonies else None
     for harmony_type, harmony_sets in harmonies.items():
         # Add a page break before "Complementary Harmonies"
         if harmony_type == "complementary":
@@ -219,26 +312,26 @@ def save_palette_to_pdf(color_palette, harmonies, filename="color_palette.pdf",
         harmony_pages.append(display_harmony_type)
         
         for idx, harmony_set in enumerate(harmony_sets):
-            harmony_data = [list(harmony_set.values())]
-            harmony_table = Table(harmony_data, colWidths=60, rowHeights=60)
+            harmony_hexes = list(harmony_set.values())
+            harmony_table = Table([harmony_hexes], colWidths=60, rowHeights=60)
             
-            harmony_style = TableStyle([
+            harmony_commands = [
                 ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
                 ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
                 ('FONTNAME', (0, 0), (-1, -1), body_font),
                 ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ])
+            ]
             
-            for i, color_hex in enumerate(harmony_set.values()):
-                harmony_style.add('BACKGROUND', (i, 0), (i, 0), colors.HexColor(color_hex))
-                text_color = colors.white if is_dark(color_hex) else colors.black
-                harmony_style.add('TEXTCOLOR', (i, 0), (i, 0), text_color)
+            for i, color_hex in enumerate(harmony_hexes):
+                fill_color, text_color = swatches[color_hex]
+                harmony_commands.append(('BACKGROUND', (i, 0), (i, 0), fill_color))
+                harmony_commands.append(('TEXTCOLOR', (i, 0), (i, 0), text_color))
             
-            harmony_table.setStyle(harmony_style)
+            harmony_table.setStyle(TableStyle(harmony_commands))
             elements.append(harmony_table)
 
         # Add page break after each harmony type, except for the last one
-        if harmony_type != list(harmonies.keys())[-1]:
+        if harmony_type != last_harmony_type:
             elements.append(PageBreak())
 
     # Function to add page numbers and header to each page
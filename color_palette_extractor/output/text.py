@@ -5,9 +5,11 @@
 Text file output generation for the Color Palette Extractor 2.0
 """
 
+import io
 import os
 import logging
-from ..utils.color import rgb_to_cmyk
+import numpy as np
+from ..utils.color import rgb_to_cmyk_array
 
 logger = logging.getLogger(__name__)
 
@@ -26,39 +28,45 @@ def save_palette_and_harmonies(color_palette, harmonies, filename="color_info.tx
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
         
-        with open(filename, 'w') as f:
-            f.write("COLOR PALETTE INFORMATION\n")
-            f.write("========================\n\n")
+        # Build the report in memory and write it in one call
+        buf = io.StringIO()
+        buf.write("COLOR PALETTE INFORMATION\n")
+        buf.write("========================\n\n")
+        
+        buf.write("Color Palette:\n")
+        buf.write("-------------\n")
+        for i, color in enumerate(color_palette):
+            buf.write(f"Color {i+1}:\n")
+            buf.write(f"  HEX: {color[0]}\n")
             
-            f.write("Color Palette:\n")
-            f.write("-------------\n")
-            for i, color in enumerate(color_palette):
-                f.write(f"Color {i+1}:\n")
-                f.write(f"  HEX: {color[0]}\n")
-                
-                # Convert NumPy integers to Python integers for RGB values
-                rgb_values = tuple(int(val) for val in color[1])
-                f.write(f"  RGB: {rgb_values}\n")
-                
-                f.write(f"  CMYK: {color[2]}\n\n")
+            # Convert NumPy integers to Python integers for RGB values
+            rgb_values = tuple(int(val) for val in color[1])
+            buf.write(f"  RGB: {rgb_values}\n")
             
-            f.write("\nColor Harmonies:\n")
-            f.write("---------------\n")
-            for harmony_type, harmony_sets in harmonies.items():
-                f.write(f"\n{harmony_type.capitalize()}:\n")
-                for i, harmony_set in enumerate(harmony_sets):
-                    f.write(f"  Set {i+1} (from Color {i+1}):\n")
-                    for color_name, color_hex in harmony_set.items():
-                        # Convert hex to RGB and CMYK
-                        hex_color = color_hex.lstrip('#')
-                        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-                        cmyk = rgb_to_cmyk(*rgb)
-                        
-                        f.write(f"    {color_name}:\n")
-                        f.write(f"      HEX: {color_hex}\n")
-                        f.write(f"      RGB: {rgb}\n")
-                        f.write(f"      CMYK: {cmyk}\n")
-                    f.write("\n")
+            buf.write(f"  CMYK: {color[2]}\n\n")
+        
+        # Convert every harmony color from hex to RGB and CMYK in one batch
+        harmony_hexes = [color_hex.lstrip('#') for harmony_sets in harmonies.values()
+                         for harmony_set in harmony_sets for color_hex in harmony_set.values()]
+        harmony_rgbs = np.frombuffer(bytes.fromhex(''.join(harmony_hexes)), dtype=np.uint8).reshape(-1, 3)
+        conversions = zip(map(tuple, harmony_rgbs.tolist()), rgb_to_cmyk_array(harmony_rgbs))
+        
+        buf.write("\nColor Harmonies:\n")
+        buf.write("---------------\n")
+        for harmony_type, harmony_sets in harmonies.items():
+            buf.write(f"\n{harmony_type.capitalize()}:\n")
+            for i, harmony_set in enumerate(harmony_sets):
+                buf.write(f"  Set {i+1} (from Color {i+1}):\n")
+                for color_name, color_hex in harmony_set.items():
+                    rgb, cmyk = next(conversions)
+                    buf.write(f"    {color_name}:\n")
+                    buf.write(f"      HEX: {color_hex}\n")
+                    buf.write(f"      RGB: {rgb}\n")
+                    buf.write(f"      CMYK: {cmyk}\n")
+                buf.write("\n")
+        
+        with open(filename, 'w') as f:
+            f.write(buf.getvalue())
         
         logger.info(f"Saved color information to {filename}")
         return filename
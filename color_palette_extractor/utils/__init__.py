@@ -2,6 +2,7 @@
 Utility modules for the Color Palette Extractor.
 """
 
-from .color import rgb_to_cmyk, cmyk_to_rgb, hex_to_rgb, rgb_to_hex, get_contrast_color
+from .color import (rgb_to_cmyk, rgb_to_cmyk_array, cmyk_to_rgb, hex_to_rgb, rgb_to_hex,
+                    get_contrast_color, rgb_to_hsv_array, hsv_to_rgb_array)
 from .image import is_valid_image, find_images_in_directory, resize_for_processing
 from .cache import CacheManager
@@ -6,45 +6,155 @@ Caching utilities for the Color Palette Extractor 2.0
 """
 
 import os
-import pickle
+import json
 import hashlib
+import time
 import logging
-from datetime import datetime, timedelta
+import functools
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+_SECONDS_PER_DAY = 24 * 60 * 60
+
+# Results recently read or stored by any CacheManager of this process, with
+# the modification time of their cache file, keyed by cache file path and
+# least recently used first, so long-lived processes (e.g. the GUI) skip the
+# disk for images they have seen before
+_MEMORY_CACHE_SIZE = 256
+_memory_cache = OrderedDict()
+
+def _remember(cache_path, cache_mtime, result):
+    """Add a result to the in-memory cache, evicting the least recently used.
+    
+    Args:
+        cache_path (str): Cache file path the result belongs to
+        cache_mtime (float): Modification time of the cache file
+        result: Cached result
+    """
+    _memory_cache[cache_path] = (cache_mtime, result)
+    _memory_cache.move_to_end(cache_path)
+    if len(_memory_cache) > _MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+@functools.lru_cache(maxsize=4096)
+def _basename_bytes(image_path):
+    """Get the file name of a path as bytes, for building cache keys.
+    
+    Batch runs look up the same paths repeatedly, so results are memoized.
+    
+    Args:
+        image_path (str): Path to the image file
+        
+    Returns:
+        bytes: File name, encoded with the filesystem encoding
+    """
+    return os.fsencode(os.path.basename(image_path))
+
+def _json_default(value):
+    """Serialize NumPy scalars and arrays, which the json module rejects.
+    
+    Args:
+        value: Object json could not serialize
+        
+    Returns:
+        int, float or list: Plain Python equivalent of value
+    """
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _restore_tuples(value):
+    """Turn the lists JSON decoding produces back into tuples, recursively.
+    
+    Args:
+        value: Decoded JSON value
+        
+    Returns:
+        The value with every list replaced by a tuple
+    """
+    if isinstance(value, list):
+        return tuple(_restore_tuples(item) for item in value)
+    return value
+
 class CacheManager:
     """Manages caching of extracted color palettes to avoid reprocessing."""
     
-    def __init__(self, cache_dir=".cache", max_age_days=30):
+    def __init__(self, cache_dir=".cache", max_age_days=30, key_mode="mtime"):
         """Initialize the cache manager.
         
         Args:
             cache_dir (str): Directory to store cache files
             max_age_days (int): Maximum age of cache files in days
+            key_mode (str): How images are identified in the cache:
+                - "mtime": file name, modification time and size (default)
+                - "hash": file contents, so copies, moved or re-touched
+                  files share entries (e.g. for caches shared between machines).
+                  Digests are only kept per instance, so every process (each
+                  run, and each batch worker) reads an image in full once more
+                  to hash it, even on a cache hit
         """
+        if key_mode not in ("mtime", "hash"):
+            raise ValueError(f"Unknown cache key mode: {key_mode}")
+        
         self.cache_dir = cache_dir
         self.max_age_days = max_age_days
+        self.key_mode = key_mode
+        
+        # Content digests by image path, with the (mtime, size) they were
+        # computed for, so unchanged files are only hashed once
+        self._digests = {}
         
         # Ensure cache directory exists
         os.makedirs(cache_dir, exist_ok=True)
         
-    def get_cache_key(self, image_path, num_colors):
+    def get_cache_key(self, image_path, num_colors, stat_result=None):
         """Generate a cache key for an image and number of colors.
         
         Args:
             image_path (str): Path to the image file
             num_colors (int): Number of colors to extract
+            stat_result (os.stat_result, optional): Stat of the image file,
+                if the caller already has it
             
         Returns:
             str: Cache key
         """
         # Get file modification time and size for cache invalidation
-        stat = os.stat(image_path)
-        file_meta = f"{os.path.basename(image_path)}_{stat.st_mtime}_{stat.st_size}_{num_colors}"
+        stat = stat_result if stat_result is not None else os.stat(image_path)
+        
+        if self.key_mode == "hash":
+            return f"{self._content_digest(image_path, stat)}_{num_colors}"
+        
+        file_meta = b"%s_%d_%d_%d" % (_basename_bytes(image_path), stat.st_mtime_ns,
+                                      stat.st_size, num_colors)
+        
+        # Generate a hash of the metadata; BLAKE2b is faster than MD5 and the
+        # key does not need to be cryptographically strong
+        return hashlib.blake2b(file_meta, digest_size=16).hexdigest()
+    
+    def _content_digest(self, image_path, stat):
+        """Hash the contents of an image, reusing the digest while its metadata is unchanged.
+        
+        Args:
+            image_path (str): Path to the image file
+            stat (os.stat_result): Stat of the image file
+            
+        Returns:
+            str: Hex BLAKE2b digest of the file contents
+        """
+        meta = (stat.st_mtime_ns, stat.st_size)
+        known = self._digests.get(image_path)
+        if known is not None and known[0] == meta:
+            return known[1]
+        
+        digest = hashlib.blake2b(digest_size=16)
+        with open(image_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
         
-        # Generate a hash of the metadata
-        return hashlib.md5(file_meta.encode()).hexdigest()
+        self._digests[image_path] = (meta, digest.hexdigest())
+        return self._digests[image_path][1]
     
     def get_cache_path(self, cache_key):
         """Get the cache file path for a cache key.
@@ -55,57 +165,84 @@ class CacheManager:
         Returns:
             str: Path to the cache file
         """
-        return os.path.join(self.cache_dir, f"{cache_key}.pkl")
+        # Entries are spread over up to 256 subdirectories named after the
+        # first two key characters, so no single directory grows too large
+        return os.path.join(self.cache_dir, cache_key[:2], f"{cache_key[2:]}.json")
     
-    def get_cached_result(self, image_path, num_colors):
+    def get_cached_result(self, image_path, num_colors, stat_result=None):
         """Get a cached result for an image if available.
         
         Args:
             image_path (str): Path to the image file
             num_colors (int): Number of colors to extract
+            stat_result (os.stat_result, optional): Stat of the image file,
+                if the caller already has it
             
         Returns:
             object or None: Cached result or None if not available
         """
         try:
-            cache_key = self.get_cache_key(image_path, num_colors)
+            cache_key = self.get_cache_key(image_path, num_colors, stat_result)
             cache_path = self.get_cache_path(cache_key)
             
-            if os.path.exists(cache_path):
-                # Check if cache is too old
-                cache_time = datetime.fromtimestamp(os.path.getmtime(cache_path))
-                if datetime.now() - cache_time > timedelta(days=self.max_age_days):
-                    logger.debug(f"Cache expired for {image_path}")
-                    return None
-                
-                # Load cached result
-                with open(cache_path, 'rb') as f:
-                    result = pickle.load(f)
-                logger.debug(f"Loaded cached result for {image_path}")
-                return result
-                
+            max_age = self.max_age_days * _SECONDS_PER_DAY
+            remembered = _memory_cache.get(cache_path)
+            if remembered is not None:
+                cache_mtime, result = remembered
+                if time.time() - cache_mtime <= max_age:
+                    _memory_cache.move_to_end(cache_path)
+                    logger.debug(f"Loaded cached result for {image_path} from memory")
+                    return list(result)
+                del _memory_cache[cache_path]
+            
+            # A single stat both checks that the entry exists and gets its age
+            try:
+                cache_mtime = os.stat(cache_path).st_mtime
+            except FileNotFoundError:
+                return None
+            
+            # Check if cache is too old
+            if time.time() - cache_mtime > max_age:
+                logger.debug(f"Cache expired for {image_path}")
+                return None
+            
+            # Load cached result
+            with open(cache_path, 'r') as f:
+                result = [_restore_tuples(item) for item in json.load(f)]
+            _remember(cache_path, cache_mtime, list(result))
+            logger.debug(f"Loaded cached result for {image_path}")
+            return result
+            
         except Exception as e:
             logger.warning(f"Error getting cached result for {image_path}: {str(e)}")
             
         return None
     
-    def store_result(self, image_path, num_colors, result):
+    def store_result(self, image_path, num_colors, result, stat_result=None):
         """Store a result in the cache.
         
         Args:
             image_path (str): Path to the image file
             num_colors (int): Number of colors extracted
             result: Result to cache
+            stat_result (os.stat_result, optional): Stat of the image file,
+                if the caller already has it
             
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            cache_key = self.get_cache_key(image_path, num_colors)
+            cache_key = self.get_cache_key(image_path, num_colors, stat_result)
             cache_path = self.get_cache_path(cache_key)
             
-            with open(cache_path, 'wb') as f:
-                pickle.dump(result, f)
+            # Write to a private temporary file and rename it into place, so
+            # concurrent worker processes never read a partially written entry
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(json.dumps(result, default=_json_default))
+            os.replace(tmp_path, cache_path)
+            _remember(cache_path, time.time(), list(result))
             logger.debug(f"Cached result for {image_path}")
             return True
             
@@ -113,6 +250,32 @@ class CacheManager:
             logger.warning(f"Error caching result for {image_path}: {str(e)}")
             return False
     
+    def _clear_old_files(self, directory, cutoff_time, descend):
+        """Remove files last modified before a cutoff from a cache directory.
+        
+        Args:
+            directory (str): Directory to clear
+            cutoff_time (float): Timestamp before which files are removed
+            descend (bool): Whether to also clear the subdirectories (shards)
+            
+        Returns:
+            int: Number of files removed
+        """
+        count = 0
+        
+        # scandir entries carry the file type, and stat() is cached per entry
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    if entry.stat().st_mtime < cutoff_time:
+                        os.remove(entry.path)
+                        _memory_cache.pop(entry.path, None)
+                        count += 1
+                elif descend and entry.is_dir(follow_symlinks=False):
+                    count += self._clear_old_files(entry.path, cutoff_time, descend=False)
+        
+        return count
+    
     def clear_cache(self, max_age_days=None):
         """Clear old cache files.
         
@@ -124,20 +287,10 @@ class CacheManager:
             int: Number of files removed
         """
         max_age = max_age_days if max_age_days is not None else self.max_age_days
-        count = 0
         
         try:
-            cutoff_time = datetime.now() - timedelta(days=max_age)
-            
-            for filename in os.listdir(self.cache_dir):
-                file_path = os.path.join(self.cache_dir, filename)
-                
-                if os.path.isfile(file_path):
-                    file_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-                    
-                    if file_time < cutoff_time:
-                        os.remove(file_path)
-                        count += 1
+            cutoff_time = time.time() - max_age * _SECONDS_PER_DAY
+            count = self._clear_old_files(self.cache_dir, cutoff_time, descend=True)
                         
             logger.info(f"Cleared {count} old cache files")
             return count
@@ -5,6 +5,8 @@
 Color conversion utilities for the Color Palette Extractor 2.0
 """
 
+import numpy as np
+
 def rgb_to_cmyk(r, g, b):
     """Convert RGB to CMYK color space.
     
@@ -34,6 +36,29 @@ def rgb_to_cmyk(r, g, b):
     
     return round(c), round(m), round(y), round(k)
 
+def rgb_to_cmyk_array(rgb):
+    """Convert a batch of RGB colors to CMYK in one vectorized pass.
+    
+    Evaluates the same expressions as rgb_to_cmyk, so results match it exactly.
+    
+    Args:
+        rgb (array-like): RGB colors of shape (N, 3) with values 0-255
+    
+    Returns:
+        list: CMYK tuples (c, m, y, k) as integer percentages (0-100)
+    """
+    rgb = np.asarray(rgb, dtype=np.float64).reshape(-1, 3)
+    cmy = 1 - rgb / 255
+    k = cmy.min(axis=1, keepdims=True)
+    
+    # Pure black is returned as (0, 0, 0, 100); avoid dividing by zero for it
+    black = (k == 1)[:, 0]
+    safe_k = np.where(k == 1, 0.0, k)
+    cmy = (cmy - safe_k) / (1 - safe_k) * 100
+    cmyk = np.rint(np.hstack((cmy, safe_k * 100))).astype(np.int64)
+    cmyk[black] = (0, 0, 0, 100)
+    return [tuple(values) for values in cmyk.tolist()]
+
 def cmyk_to_rgb(c, m, y, k):
     """Convert CMYK to RGB color space.
     
@@ -63,8 +88,7 @@ def hex_to_rgb(hex_color):
     Returns:
         tuple: RGB values (r, g, b) as integers (0-255)
     """
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    return tuple(bytes.fromhex(hex_color.lstrip('#')))
 
 def rgb_to_hex(rgb):
     """Convert RGB tuple to hex color string.
@@ -75,7 +99,10 @@ def rgb_to_hex(rgb):
     Returns:
         str: Hex color string (#RRGGBB)
     """
-    return '#{:02x}{:02x}{:02x}'.format(*rgb)
+    # bytes() would read an array's raw buffer rather than its values
+    if isinstance(rgb, np.ndarray):
+        rgb = rgb.tolist()
+    return '#' + bytes(rgb).hex()
 
 def get_contrast_color(hex_color):
     """Determine the best contrasting color (black or white) for text on given background.
@@ -86,10 +113,68 @@ def get_contrast_color(hex_color):
     Returns:
         str: '#FFFFFF' for white or '#000000' for black
     """
-    hex_color = hex_color.lstrip('#')
-    r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    r, g, b = bytes.fromhex(hex_color.lstrip('#'))
+    
+    # Luminance (0.299 R + 0.587 G + 0.114 B) / 255 > 0.5, scaled by 1000 * 255
+    # so the test stays in exact integer arithmetic
+    return '#000000' if 299 * r + 587 * g + 114 * b > 127500 else '#FFFFFF'
+
+def rgb_to_hsv_array(rgb):
+    """Convert a batch of RGB colors to HSV in one vectorized pass.
+    
+    Mirrors colorsys.rgb_to_hsv element for element, so results match the
+    scalar conversion exactly.
+    
+    Args:
+        rgb (array-like): RGB colors of shape (N, 3) with values 0-255
+    
+    Returns:
+        numpy.ndarray: HSV colors of shape (N, 3) with all components in range 0-1
+    """
+    rgb = np.asarray(rgb, dtype=np.float64).reshape(-1, 3) / 255
+    r, g, b = rgb.T
+    maxc = rgb.max(axis=1)
+    minc = rgb.min(axis=1)
+    rangec = maxc - minc
+    chromatic = rangec > 0
+    
+    # Avoid division by zero for grays; their hue and saturation are forced to 0
+    safe_range = np.where(chromatic, rangec, 1.0)
+    safe_max = np.where(maxc > 0, maxc, 1.0)
+    rc = (maxc - r) / safe_range
+    gc = (maxc - g) / safe_range
+    bc = (maxc - b) / safe_range
+    
+    h = np.select([r == maxc, g == maxc], [bc - gc, 2.0 + rc - bc], 4.0 + gc - rc)
+    h = np.where(chromatic, (h / 6.0) % 1.0, 0.0)
+    s = np.where(chromatic, rangec / safe_max, 0.0)
+    
+    return np.column_stack((h, s, maxc))
+
+def hsv_to_rgb_array(h, s, v):
+    """Convert arrays of HSV components to RGB in one vectorized pass.
     
-    # Calculate luminance - modern formula
-    luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
+    Mirrors colorsys.hsv_to_rgb element for element, so results match the
+    scalar conversion exactly.
     
-    return '#000000' if luminance > 0.5 else '#FFFFFF'
+    Args:
+        h (array-like): Hues in range 0-1
+        s (array-like): Saturations in range 0-1, broadcastable against h
+        v (array-like): Values in range 0-1, broadcastable against h
+        
+    Returns:
+        numpy.ndarray: RGB colors with a trailing axis of 3, components in range 0-1
+    """
+    h, s, v = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (h, s, v)))
+    i = np.floor(h * 6.0)
+    f = (h * 6.0) - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    
+    # Gray (s == 0) needs no special case: p, q and t all equal v exactly
+    sector = i.astype(np.int64) % 6
+    r = np.choose(sector, [v, q, p, p, t, v])
+    g = np.choose(sector, [t, v, v, q, p, p])
+    b = np.choose(sector, [p, p, t, v, v, q])
+    return np.stack((r, g, b), axis=-1)
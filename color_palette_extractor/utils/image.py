@@ -7,12 +7,24 @@ Image processing utilities for the Color Palette Extractor 2.0
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
+import PIL
 from PIL import Image
 
 logger = logging.getLogger(__name__)
 
-# List of supported image extensions
-SUPPORTED_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif')
+# Pillow-SIMD releases carry a ".postN" suffix on the Pillow version they track
+_PILLOW_BUILD = f"Pillow-SIMD {PIL.__version__}" if ".post" in PIL.__version__ else f"Pillow {PIL.__version__}"
+
+# Continuous-tone modes without alpha, which Image.reduce can average
+_REDUCIBLE_MODES = frozenset(('RGB', 'RGBX', 'L', 'CMYK', 'YCbCr'))
+
+# Supported image extensions, lowercase
+SUPPORTED_EXTENSIONS = frozenset(('.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif'))
+
+# Leading bytes of the supported formats (JPEG, PNG, BMP, little and big
+# endian TIFF); GIF is included for files with a misleading extension
+_IMAGE_SIGNATURES = (b'\xff\xd8\xff', b'\x89PNG\r\n\x1a\n', b'BM', b'II*\x00', b'MM\x00*', b'GIF8')
 
 def is_valid_image(file_path):
     """Check if a file is a valid image.
@@ -27,11 +39,28 @@ def is_valid_image(file_path):
         return False
         
     # Check file extension
-    if not file_path.lower().endswith(SUPPORTED_EXTENSIONS):
+    if os.path.splitext(file_path)[1].lower() not in SUPPORTED_EXTENSIONS:
         return False
         
-    # Try to open the file as an image
+    return _verify_image(file_path)
+
+def _verify_image(file_path):
+    """Check that an existing file with a supported extension is an image.
+    
+    Files starting with a known image signature are accepted from their
+    header alone; only the rest are parsed in full by PIL.
+    
+    Args:
+        file_path (str): Path to the file
+        
+    Returns:
+        bool: True if the file is a valid image, False otherwise
+    """
     try:
+        with open(file_path, 'rb') as f:
+            if f.read(16).startswith(_IMAGE_SIGNATURES):
+                return True
+        
         with Image.open(file_path) as img:
             img.verify()
         return True
@@ -39,9 +68,38 @@ def is_valid_image(file_path):
         logger.debug(f"Invalid image file {file_path}: {str(e)}")
         return False
 
+def _scan_images(directory_path, recursive, candidates):
+    """Collect files of a directory that have a supported extension.
+    
+    Uses os.scandir, whose entries carry the file type from the directory
+    listing, so only candidates with a supported extension cost a stat call.
+    Subdirectories are visited after the files, in the same order as os.walk.
+    
+    Args:
+        directory_path (str): Path to the directory
+        recursive (bool): Whether to descend into subdirectories
+        candidates (list): List the found file paths are appended to
+    """
+    subdirectories = []
+    with os.scandir(directory_path) as entries:
+        for entry in entries:
+            if os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS and entry.is_file():
+                candidates.append(entry.path)
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+    
+    for subdirectory in subdirectories:
+        try:
+            _scan_images(subdirectory, recursive, candidates)
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {subdirectory}: {str(e)}")
+
 def find_images_in_directory(directory_path, recursive=False):
     """Find all valid image files in a directory.
     
+    Candidates are validated in a thread pool, since the checks mostly wait
+    on disk reads; the result keeps the directory listing order.
+    
     Args:
         directory_path (str): Path to the directory
         recursive (bool): Whether to search recursively
@@ -53,21 +111,13 @@ def find_images_in_directory(directory_path, recursive=False):
         logger.error(f"Directory does not exist: {directory_path}")
         return []
         
-    image_paths = []
-    
-    if recursive:
-        # Walk through directory recursively
-        for root, _, files in os.walk(directory_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                if is_valid_image(file_path):
-                    image_paths.append(file_path)
-    else:
-        # Only search in the top-level directory
-        for file in os.listdir(directory_path):
-            file_path = os.path.join(directory_path, file)
-            if is_valid_image(file_path):
-                image_paths.append(file_path)
+    candidates = []
+    _scan_images(directory_path, recursive, candidates)
+    
+    max_workers = min(32, (os.cpu_count() or 1) * 4, max(1, len(candidates)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        image_paths = [path for path, valid in zip(candidates, executor.map(_verify_image, candidates))
+                       if valid]
                 
     logger.info(f"Found {len(image_paths)} valid images in {directory_path}")
     return image_paths
@@ -75,6 +125,12 @@ def find_images_in_directory(directory_path, recursive=False):
 def resize_for_processing(image, max_dimension=1000):
     """Resize an image to a maximum dimension while preserving aspect ratio.
     
+    JPEGs that have not been decoded yet are decoded at a reduced scale.
+    Images still at least twice as large as needed are then shrunk by an
+    integer factor with Image.reduce (box averaging) and brought to the exact
+    size with a bilinear pass, which keeps the color statistics clustering
+    needs at a fraction of the cost of a full-size LANCZOS filter.
+    
     Args:
         image (PIL.Image): PIL Image object
         max_dimension (int): Maximum dimension (width or height)
@@ -85,11 +141,21 @@ def resize_for_processing(image, max_dimension=1000):
     width, height = image.size
     if max(width, height) <= max_dimension:
         return image
+    
+    logger.debug(f"Resizing with {_PILLOW_BUILD}")
         
     scale_factor = max_dimension / max(width, height)
     new_width = int(width * scale_factor)
     new_height = int(height * scale_factor)
     
+    # Not-yet-decoded JPEGs can be decoded at 1/2, 1/4 or 1/8 scale, as long
+    # as the result stays at least as large as the target; no-op otherwise
+    image.draft(None, (new_width, new_height))
+    
+    factor = max(image.size) // max_dimension
+    if factor >= 2 and image.mode in _REDUCIBLE_MODES:
+        return image.reduce(factor).resize((new_width, new_height), Image.BILINEAR)
+    
     return image.resize((new_width, new_height), Image.LANCZOS)
 
 def ensure_rgb(image):
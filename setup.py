@@ -3,7 +3,7 @@ from setuptools import setup, find_packages
 setup(
     name="color-palette-extractor-V2",
     version="2.1.0",
-    packages=find_packages(),
+    packages=find_packages(exclude=["tests", "tests.*"]),
     include_package_data=True,
     install_requires=[
         "numpy>=1.21.5",
@@ -17,7 +17,7 @@ setup(
             "color-palette-extractor-V2=color_palette_extractor.cli:main",
         ],
     },
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     author="Michail Semoglou",
     description="Extract color palettes from images and generate harmonies",
     long_description=open("README.md").read(),
@@ -0,0 +1,65 @@
+"""Tests for batch processing of images."""
+
+import io
+import shutil
+
+import pytest
+from PIL import Image
+from tqdm import tqdm
+
+from color_palette_extractor import batch
+from color_palette_extractor.batch import iter_process_images
+
+
+@pytest.fixture
+def image_paths(tmp_path):
+    """Two distinct images, each with a byte-identical copy."""
+    paths = []
+    for name, color in (('red', (200, 30, 30)), ('blue', (30, 30, 200))):
+        image = Image.new('RGB', (32, 32), color)
+        image.paste((240, 240, 240), (0, 0, 16, 32))
+        path = tmp_path / f'{name}.png'
+        image.save(path)
+        copy_path = tmp_path / f'{name}_copy.png'
+        shutil.copyfile(path, copy_path)
+        paths += [str(path), str(copy_path)]
+    return paths
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_dedup_with_skip_existing(tmp_path, image_paths, max_workers):
+    output_dir = str(tmp_path / 'out')
+    config = {'dedup': True, 'skip_existing': True}
+
+    def run():
+        return list(iter_process_images(
+            image_paths, num_colors=2, output_dir=output_dir, generate_pdf=False,
+            use_cache=False, max_workers=max_workers, config=config
+        ))
+
+    first = run()
+    assert [r['success'] for r in first] == [True] * 4
+
+    # Every image is skipped now, including the first copies, which then
+    # carry no palette for their duplicates
+    second = run()
+    assert [r['success'] for r in second] == [True] * 4
+    assert sorted(r['image_path'] for r in second) == sorted(image_paths)
+    assert all('palette' not in r for r in second)
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_dedup_progress_counts_first_copies(tmp_path, image_paths, max_workers, monkeypatch):
+    bars = []
+
+    def progress(iterable, total):
+        bars.append(tqdm(iterable, total=total, file=io.StringIO()))
+        return bars[-1]
+
+    monkeypatch.setattr(batch, '_progress', progress)
+    results = list(iter_process_images(
+        image_paths, num_colors=2, output_dir=str(tmp_path / 'out'), generate_pdf=False,
+        use_cache=False, max_workers=max_workers, config={'dedup': True}
+    ))
+    assert len(results) == 4
+    assert [(bar.n, bar.total) for bar in bars] == [(2, 2)]
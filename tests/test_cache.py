@@ -0,0 +1,52 @@
+"""Tests for the palette cache."""
+
+import numpy as np
+import pytest
+
+from color_palette_extractor.utils import cache
+from color_palette_extractor.utils.cache import CacheManager, _restore_tuples
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    path = tmp_path / 'image.png'
+    path.write_bytes(b'not decoded by the cache')
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def empty_memory_cache():
+    cache._memory_cache.clear()
+    yield
+    cache._memory_cache.clear()
+
+
+def test_restore_tuples():
+    assert _restore_tuples(['#ff0000', [255, 0, 0], [0, 100, 100, 0]]) == \
+        ('#ff0000', (255, 0, 0), (0, 100, 100, 0))
+    assert _restore_tuples([[1, [2, 3]], 4]) == ((1, (2, 3)), 4)
+    assert _restore_tuples('#ff0000') == '#ff0000'
+
+
+def test_round_trip_from_disk(tmp_path, image_path):
+    # Palettes hold NumPy integers, as produced by extract_color_palette
+    rgb = np.array([255, 0, 0])
+    palette = [('#ff0000', tuple(rgb), (0, 100, 100, 0)),
+               ('#00ff00', (0, 255, 0), (100, 0, 100, 0))]
+    manager = CacheManager(cache_dir=str(tmp_path / 'cache'))
+    assert manager.store_result(image_path, 2, palette)
+
+    # Read the entry back from its JSON file rather than from memory
+    cache._memory_cache.clear()
+    result = manager.get_cached_result(image_path, 2)
+    assert result == palette
+    assert all(isinstance(color[1], tuple) and isinstance(color[2], tuple) for color in result)
+
+    # The entry read from disk is now served from memory, unchanged
+    assert manager.get_cached_result(image_path, 2) == palette
+
+
+def test_key_includes_num_colors(tmp_path, image_path):
+    manager = CacheManager(cache_dir=str(tmp_path / 'cache'))
+    manager.store_result(image_path, 2, [('#ff0000', (255, 0, 0), (0, 100, 100, 0))])
+    assert manager.get_cached_result(image_path, 3) is None
@@ -0,0 +1,46 @@
+"""Tests for configuration management."""
+
+from color_palette_extractor.config import DEFAULT_CONFIG, ConfigManager
+
+
+def make_manager(tmp_path):
+    return ConfigManager(str(tmp_path / 'config.json'))
+
+
+def test_set_updates_get(tmp_path):
+    manager = make_manager(tmp_path)
+    assert manager.get('pdf_options.margin') == 36
+    assert manager.set('pdf_options.margin', 72)
+    assert manager.get('pdf_options.margin') == 72
+    assert manager.get('pdf_options')['margin'] == 72
+    assert manager.set('num_colors', 8)
+    assert manager.get('num_colors') == 8
+
+
+def test_direct_changes_update_get(tmp_path):
+    manager = make_manager(tmp_path)
+    manager.get('pdf_options.margin')
+    manager.config['pdf_options']['margin'] = 48
+    assert manager.get('pdf_options.margin') == 48
+    manager.config = {'pdf_options': {'margin': 12}}
+    assert manager.get('pdf_options.margin') == 12
+    assert manager.get('pdf_options.page_size', 'Letter') == 'Letter'
+
+
+def test_reset_restores_defaults(tmp_path):
+    manager = make_manager(tmp_path)
+    manager.set('pdf_options.margin', 72)
+    assert manager.reset_to_defaults()
+    assert manager.get('pdf_options.margin') == 36
+
+    # The defaults themselves are never modified through a manager
+    manager.set('pdf_options.margin', 72)
+    assert DEFAULT_CONFIG['pdf_options']['margin'] == 36
+
+
+def test_load_merges_file_with_defaults(tmp_path):
+    (tmp_path / 'config.json').write_text('{"pdf_options": {"margin": 18}}')
+    manager = make_manager(tmp_path)
+    assert manager.get('pdf_options.margin') == 18
+    assert manager.get('pdf_options.page_size') == 'A4'
+    assert DEFAULT_CONFIG['pdf_options']['margin'] == 36